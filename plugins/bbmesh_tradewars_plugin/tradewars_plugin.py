@@ -44,6 +44,7 @@ class TradeWarsPlugin(InteractivePlugin):
             self.logger.info("Initializing universe...")
             self.universe.generate_universe()
             self.universe.select_port_sectors()
+            port_names = self.universe.generate_port_names()
 
             # Create sectors in database
             for sector_id in range(1, 101):
@@ -51,9 +52,9 @@ class TradeWarsPlugin(InteractivePlugin):
 
                 # Determine if this sector has a port
                 port_id = None
-                if sector_id in self.universe.ports:
+                if sector_id in port_names:
                     # Create port for this sector
-                    port_name = self.universe.get_port_name(sector_id)
+                    port_name = port_names[sector_id]
                     inventory = self.trade_calc.generate_port_inventory()
                     port_id = self.storage.create_port(
                         sector_id, port_name, 5000000, inventory
@@ -801,15 +802,16 @@ class TradeWarsPlugin(InteractivePlugin):
                 # Buying from port
                 cost = self.trade_calc.execute_purchase(quantity, price)
                 new_credits = player["credits"] - cost
-                new_cargo = ship["cargo"].copy()
-                new_cargo[commodity] += quantity
+                # ship is a fresh row from storage, so mutate its cargo in place
+                cargo = ship["cargo"]
+                cargo[commodity] += quantity
 
                 # Update storage
                 self.storage.update_player_stats(
                     player_id, credits=new_credits,
                     total_trades=player["total_trades"] + 1
                 )
-                self.storage.update_ship_cargo(ship["ship_id"], new_cargo)
+                self.storage.update_ship_cargo(ship["ship_id"], cargo)
 
                 # Update port
                 new_inventory = self.trade_calc.update_port_inventory_after_buy(
@@ -818,7 +820,7 @@ class TradeWarsPlugin(InteractivePlugin):
                 self.storage.update_port_inventory(port_id, new_inventory)
                 self.storage.update_port_credits(port_id, port["credits"] + cost)
 
-                cargo_used = self.storage.get_cargo_used(new_cargo)
+                cargo_used = self.storage.get_cargo_used(cargo)
                 response_text = self.formatter.trade_executed(
                     commodity, quantity, cost, new_credits, cargo_used, ship["cargo_holds"]
                 )
@@ -827,15 +829,15 @@ class TradeWarsPlugin(InteractivePlugin):
                 # Selling to port
                 revenue = self.trade_calc.execute_sale(quantity, price)
                 new_credits = player["credits"] + revenue
-                new_cargo = ship["cargo"].copy()
-                new_cargo[commodity] -= quantity
+                cargo = ship["cargo"]
+                cargo[commodity] -= quantity
 
                 # Update storage
                 self.storage.update_player_stats(
                     player_id, credits=new_credits,
                     total_trades=player["total_trades"] + 1
                 )
-                self.storage.update_ship_cargo(ship["ship_id"], new_cargo)
+                self.storage.update_ship_cargo(ship["ship_id"], cargo)
 
                 # Update port
                 new_inventory = self.trade_calc.update_port_inventory_after_sell(
@@ -844,7 +846,7 @@ class TradeWarsPlugin(InteractivePlugin):
                 self.storage.update_port_inventory(port_id, new_inventory)
                 self.storage.update_port_credits(port_id, port["credits"] - revenue)
 
-                cargo_used = self.storage.get_cargo_used(new_cargo)
+                cargo_used = self.storage.get_cargo_used(cargo)
                 response_text = self.formatter.trade_sold(
                     commodity, quantity, revenue, new_credits, cargo_used
                 )
@@ -874,15 +876,11 @@ class TradeWarsPlugin(InteractivePlugin):
     def _handle_cargo_view_input(self, context: PluginContext, player_id: int,
                                 user_input: str) -> PluginResponse:
         """Return from cargo view"""
-        session_data = context.session_data.copy()
-        session_data[f"{self.name}_state"] = "SECTOR_VIEW"
         return self._handle_sector_view(context, player_id)
 
     def _handle_stats_view_input(self, context: PluginContext, player_id: int,
                                 user_input: str) -> PluginResponse:
         """Return from stats view"""
-        session_data = context.session_data.copy()
-        session_data[f"{self.name}_state"] = "SECTOR_VIEW"
         return self._handle_sector_view(context, player_id)
 
     def cleanup(self) -> None:
@@ -13,10 +13,11 @@ class UniverseManager:
 
     TOTAL_SECTORS = 100
     PORTS_COUNT = 30
-    PORT_DESCRIPTIONS = [
+    MAX_SHORTCUT = 20  # Maximum sector distance for random connections
+    PORT_DESCRIPTIONS: Tuple[str, ...] = (
         "Trading Hub", "Relay Station", "Commercial Port", "Dock",
         "Market Station", "Exchange Point", "Supply Depot", "Outpost"
-    ]
+    )
 
     def __init__(self, seed: int = None):
         """Initialize universe manager with optional seed"""
@@ -32,50 +33,39 @@ class UniverseManager:
         Returns:
             Dictionary mapping sector_id -> list of connected_sector_ids
         """
-        self.sectors = {}
-
-        # Create all sectors with empty connections initially
-        for i in range(1, self.TOTAL_SECTORS + 1):
-            self.sectors[i] = []
+        # Build adjacency as sets for O(1) membership checks while adding edges
+        adjacency: Dict[int, set] = {i: set() for i in range(1, self.TOTAL_SECTORS + 1)}
 
         # Create connections ensuring connectivity
         # First, create a simple path through all sectors
         for i in range(1, self.TOTAL_SECTORS):
             # Connect sector i to sector i+1
-            if i + 1 not in self.sectors[i]:
-                self.sectors[i].append(i + 1)
-            if i not in self.sectors[i + 1]:
-                self.sectors[i + 1].append(i)
+            adjacency[i].add(i + 1)
+            adjacency[i + 1].add(i)
 
         # Add random connections (2-3 per sector on average)
         for sector_id in range(1, self.TOTAL_SECTORS + 1):
-            current_connections = len(self.sectors[sector_id])
+            neighbors = adjacency[sector_id]
+            current_connections = len(neighbors)
 
             # Add 0-2 more random connections
             needed = random.randint(0, 2)
             attempts = 0
 
-            while len(self.sectors[sector_id]) < current_connections + needed and attempts < 10:
-                target = random.randint(1, self.TOTAL_SECTORS)
-
-                # Don't connect to self, and limit distance to prevent too-long shortcuts
-                if target != sector_id and target not in self.sectors[sector_id]:
-                    distance = abs(target - sector_id)
-                    # Bias toward nearby connections
-                    if distance > 20 and random.random() > 0.3:
-                        attempts += 1
-                        continue
+            while len(neighbors) < current_connections + needed and attempts < 10:
+                # Sample an offset biased toward nearby sectors, which keeps
+                # shortcuts short without rejecting distant candidates
+                target = sector_id + int(random.triangular(-self.MAX_SHORTCUT, self.MAX_SHORTCUT, 0))
 
-                    if target not in self.sectors[sector_id]:
-                        self.sectors[sector_id].append(target)
-                    if sector_id not in self.sectors[target]:
-                        self.sectors[target].append(sector_id)
+                # Don't connect to self or outside the universe
+                if 1 <= target <= self.TOTAL_SECTORS and target != sector_id:
+                    neighbors.add(target)
+                    adjacency[target].add(sector_id)
 
                 attempts += 1
 
-        # Sort connections for consistency
-        for sector_id in self.sectors:
-            self.sectors[sector_id].sort()
+        # Freeze to sorted lists for consistency
+        self.sectors = {sector_id: sorted(neighbors) for sector_id, neighbors in adjacency.items()}
 
         return self.sectors
 
@@ -104,6 +94,18 @@ class UniverseManager:
         desc = random.choice(self.PORT_DESCRIPTIONS)
         return f"{desc}-{sector_id}"
 
+    def generate_port_names(self) -> Dict[int, str]:
+        """Generate names for all port sectors in one pass"""
+        if not self.ports:
+            self.select_port_sectors()
+
+        port_sectors = sorted(self.ports)
+        descriptions = random.choices(self.PORT_DESCRIPTIONS, k=len(port_sectors))
+        return {
+            sector_id: f"{desc}-{sector_id}"
+            for sector_id, desc in zip(port_sectors, descriptions)
+        }
+
     def find_path(self, start_sector: int, end_sector: int) -> Optional[List[int]]:
         """
         Find shortest path between sectors using Dijkstra's algorithm
@@ -252,10 +252,20 @@ BACKUP_DIR="/var/lib/bbmesh/backups"
 DATE=$(date +%Y%m%d_%H%M%S)
 BACKUP_FILE="bbmesh_backup_${DATE}.tar.gz"
 
+# The database runs in WAL mode, so committed rows may still live in
+# bbmesh.db-wal. Take a consistent online snapshot with sqlite3's .backup;
+# without the sqlite3 CLI, copy the WAL and shared-memory files alongside.
+SNAPSHOT_DIR=$(mktemp -d)
+trap 'rm -rf "$SNAPSHOT_DIR"' EXIT
+if ! sqlite3 /var/lib/bbmesh/bbmesh.db ".backup '${SNAPSHOT_DIR}/bbmesh.db'" 2>/dev/null; then
+    rm -f "${SNAPSHOT_DIR}/bbmesh.db"
+    cp /var/lib/bbmesh/bbmesh.db* "$SNAPSHOT_DIR"/ 2>/dev/null || true
+fi
+
 # Create compressed backup
 tar -czf "${BACKUP_DIR}/${BACKUP_FILE}" \
     -C /opt/bbmesh config/ \
-    -C /var/lib/bbmesh bbmesh.db \
+    -C "$SNAPSHOT_DIR" . \
     -C /var/log/bbmesh bbmesh.log 2>/dev/null || true
 
 # Keep only last 30 backups
@@ -10,7 +10,28 @@ __version__ = "0.2.0-beta.1"
 __author__ = "BBMesh Team"
 __email__ = "contact@bbmesh.dev"
 
-from .core.server import BBMeshServer
-from .core.config import Config
+import importlib
 
-__all__ = ["BBMeshServer", "Config"]
\ No newline at end of file
+# Public names resolved on first access (PEP 562) so that importing the
+# package, e.g. for the CLI, doesn't pull in the Meshtastic stack
+_LAZY_ATTRS = {
+    "BBMeshServer": "bbmesh.core.server",
+    "Config": "bbmesh.core.config",
+    "ConnectionTester": "bbmesh.utils.connection_test",
+}
+
+__all__ = ["BBMeshServer", "Config", "ConnectionTester"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
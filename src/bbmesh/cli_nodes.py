@@ -6,14 +6,41 @@ Command-line interface for managing tracked nodes and admin registrations.
 """
 
 import click
+import io
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
 
 from bbmesh.core.node_tracker import NodeTracker
 from bbmesh.core.admin_manager import AdminManager
 
 
+# Number of table rows buffered before each write to stdout
+ECHO_BATCH_SIZE = 100
+
+# Table layouts shared by the header and every row
+NODE_ROW_FORMAT = "{node_id:<15} {node_name:<20} {first_seen:<20} {last_seen:<20} {message_count:<10}\n"
+ADMIN_ROW_FORMAT = "{node_id:<15} {node_name:<20} {method:<10} {registered:<20}\n"
+
+# Minimal AdminManager config for offline management (no PSK, no config admins)
+ADMIN_MANAGER_CONFIG = {
+    'notification_format': '🆕 {node_name} ({node_id})',
+    'admin_psk': None,
+    'psk_enabled': False,
+    'admin_nodes': []
+}
+
+
+def _get_admin_manager(ctx) -> AdminManager:
+    """Return the AdminManager shared by commands in this context, creating it on first use"""
+    manager = ctx.obj.get('admin_manager')
+    if manager is None:
+        manager = ctx.obj['admin_manager'] = AdminManager(
+            ctx.obj['db_path'], ADMIN_MANAGER_CONFIG, None
+        )
+        ctx.call_on_close(manager.close)
+    return manager
+
+
 @click.group()
 @click.option('--db', default='data/bbmesh.db', help='Database path')
 @click.pass_context
@@ -33,35 +60,45 @@ def list(ctx, limit):
     """List all tracked nodes"""
     try:
         tracker = NodeTracker(ctx.obj['db_path'])
-        nodes = tracker.get_all_nodes(limit=limit)
         
-        if not nodes:
-            click.echo("No nodes tracked yet.")
-            return
-        
-        # Print header
-        click.echo(f"\n{'Node ID':<15} {'Name':<20} {'First Seen':<20} {'Last Seen':<20} {'Messages':<10}")
-        click.echo("-" * 90)
+        # Stream rows from the database into a buffer that is written out
+        # every ECHO_BATCH_SIZE rows, keeping memory bounded without an echo
+        # per row; the footer goes out with the final batch
+        buf = io.StringIO()
+        buf.write("\n" + NODE_ROW_FORMAT.format(
+            node_id='Node ID', node_name='Name', first_seen='First Seen',
+            last_seen='Last Seen', message_count='Messages'
+        ))
+        buf.write("-" * 90 + "\n")
+        count = 0
         
-        # Print nodes
-        for node in nodes:
+        for node in tracker.iter_nodes(limit=limit):
             first_seen = node['first_seen_at'][:19] if node['first_seen_at'] else 'N/A'
             last_seen = node['last_seen_at'][:19] if node['last_seen_at'] else 'N/A'
             
-            click.echo(
-                f"{node['node_id']:<15} "
-                f"{node['node_name']:<20} "
-                f"{first_seen:<20} "
-                f"{last_seen:<20} "
-                f"{node['message_count']:<10}"
-            )
+            buf.write(NODE_ROW_FORMAT.format(
+                node_id=node['node_id'],
+                node_name=node['node_name'],
+                first_seen=first_seen,
+                last_seen=last_seen,
+                message_count=node['message_count']
+            ))
+            count += 1
+            
+            if count % ECHO_BATCH_SIZE == 0:
+                click.echo(buf.getvalue(), nl=False)
+                buf = io.StringIO()
+        
+        if not count:
+            click.echo("No nodes tracked yet.")
+            return
         
-        # Print statistics
         stats = tracker.get_statistics()
-        click.echo(f"\nTotal: {stats['total_nodes']} nodes | "
+        buf.write(f"\nTotal: {stats['total_nodes']} nodes | "
                   f"Active: {stats['active_nodes']} | "
                   f"Inactive: {stats['inactive_nodes']} | "
-                  f"Messages: {stats['total_messages']}")
+                  f"Messages: {stats['total_messages']}\n")
+        click.echo(buf.getvalue(), nl=False)
         
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -91,9 +128,7 @@ def info(ctx, node_id):
         click.echo(f"  Updated:       {node['updated_at']}")
         
         # Calculate days since last seen
-        last_seen = datetime.fromisoformat(node['last_seen_at'])
-        days_ago = (datetime.now() - last_seen).days
-        click.echo(f"  Days Inactive: {days_ago}")
+        click.echo(f"  Days Inactive: {tracker.days_since_seen(node)}")
         
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -175,40 +210,35 @@ def stats(ctx):
 def admins(ctx):
     """List registered admin nodes"""
     try:
-        # Create minimal config for AdminManager
-        config = {
-            'notification_format': '🆕 {node_name} ({node_id})',
-            'admin_psk': None,
-            'psk_enabled': False,
-            'admin_nodes': []
-        }
-        manager = AdminManager(ctx.obj['db_path'], config, None)
+        manager = _get_admin_manager(ctx)
         admins = manager.get_active_admins()
         
         if not admins:
             click.echo("No admin nodes registered.")
             return
         
-        # Print header
-        click.echo(f"\n{'Node ID':<15} {'Name':<20} {'Method':<10} {'Registered':<20}")
-        click.echo("-" * 70)
+        # Build the whole table, footer included, and write it in one go
+        buf = io.StringIO()
+        buf.write("\n" + ADMIN_ROW_FORMAT.format(
+            node_id='Node ID', node_name='Name', method='Method', registered='Registered'
+        ))
+        buf.write("-" * 70 + "\n")
         
-        # Print admins
         for admin in admins:
-            registered = admin['registered_at'][:19] if admin['registered_at'] else 'N/A'
+            registered = admin.registered_at[:19] if admin.registered_at else 'N/A'
             
-            click.echo(
-                f"{admin['node_id']:<15} "
-                f"{admin['node_name']:<20} "
-                f"{admin['registration_method']:<10} "
-                f"{registered:<20}"
-            )
+            buf.write(ADMIN_ROW_FORMAT.format(
+                node_id=admin.node_id,
+                node_name=admin.node_name,
+                method=admin.registration_method,
+                registered=registered
+            ))
         
-        # Print count
         counts = manager.get_admin_count()
-        click.echo(f"\nTotal: {counts['total']} admins | "
+        buf.write(f"\nTotal: {counts['total']} admins | "
                   f"Active: {counts['active']} | "
-                  f"Inactive: {counts['inactive']}")
+                  f"Inactive: {counts['inactive']}\n")
+        click.echo(buf.getvalue(), nl=False)
         
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -221,13 +251,7 @@ def admins(ctx):
 def deactivate_admin(ctx, node_id):
     """Deactivate an admin node"""
     try:
-        config = {
-            'notification_format': '🆕 {node_name} ({node_id})',
-            'admin_psk': None,
-            'psk_enabled': False,
-            'admin_nodes': []
-        }
-        manager = AdminManager(ctx.obj['db_path'], config, None)
+        manager = _get_admin_manager(ctx)
         
         if manager.deactivate_admin(node_id):
             click.echo(f"✅ Deactivated admin {node_id}")
@@ -245,13 +269,7 @@ def deactivate_admin(ctx, node_id):
 def activate_admin(ctx, node_id):
     """Activate an admin node"""
     try:
-        config = {
-            'notification_format': '🆕 {node_name} ({node_id})',
-            'admin_psk': None,
-            'psk_enabled': False,
-            'admin_nodes': []
-        }
-        manager = AdminManager(ctx.obj['db_path'], config, None)
+        manager = _get_admin_manager(ctx)
         
         if manager.activate_admin(node_id):
             click.echo(f"✅ Activated admin {node_id}")
@@ -270,13 +288,7 @@ def activate_admin(ctx, node_id):
 def remove_admin(ctx, node_id):
     """Remove an admin node from database"""
     try:
-        config = {
-            'notification_format': '🆕 {node_name} ({node_id})',
-            'admin_psk': None,
-            'psk_enabled': False,
-            'admin_nodes': []
-        }
-        manager = AdminManager(ctx.obj['db_path'], config, None)
+        manager = _get_admin_manager(ctx)
         
         if manager.remove_admin(node_id):
             click.echo(f"✅ Removed admin {node_id}")
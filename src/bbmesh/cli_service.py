@@ -0,0 +1,380 @@
+"""
+Service management commands for the BBMesh CLI
+
+These commands are loaded on demand by the main ``bbmesh`` group so that
+everyday commands don't pay for registering them.
+"""
+
+import click
+import importlib.util
+import sys
+import os
+import pwd
+import shutil
+import stat
+import subprocess
+from pathlib import Path
+
+
+@click.command("install-service")
+@click.option(
+    "--user",
+    default="bbmesh",
+    help="Service user name (default: bbmesh)"
+)
+@click.option(
+    "--install-dir",
+    default="/opt/bbmesh",
+    help="Installation directory (default: /opt/bbmesh)"
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Force installation even if service already exists"
+)
+def install_service(user: str, install_dir: str, force: bool):
+    """Install BBMesh as a systemd service"""
+    try:
+        # Check if running as root
+        if os.geteuid() != 0:
+            click.echo("Error: This command must be run as root (use sudo)", err=True)
+            sys.exit(1)
+        
+        # Get the project directory (where this script is located)
+        script_dir = Path(__file__).parent.parent.parent
+        install_script = script_dir / "scripts" / "install-service.sh"
+        
+        if not install_script.exists():
+            click.echo(f"Error: Installation script not found at {install_script}", err=True)
+            sys.exit(1)
+        
+        # Check if service already exists
+        result = subprocess.run(
+            ["systemctl", "is-enabled", "bbmesh"],
+            capture_output=True,
+            text=True
+        )
+        
+        if result.returncode == 0 and not force:
+            click.echo("BBMesh service is already installed.")
+            click.echo("Use --force to reinstall or 'bbmesh uninstall-service' to remove first.")
+            sys.exit(0)
+        
+        # Run the installation script
+        click.echo("Installing BBMesh as systemd service...")
+        click.echo(f"Installation script: {install_script}")
+        
+        result = subprocess.run([str(install_script)], check=False)
+        
+        if result.returncode == 0:
+            click.echo("✓ BBMesh service installed successfully!")
+        else:
+            click.echo("✗ Service installation failed", err=True)
+            sys.exit(1)
+            
+    except Exception as e:
+        click.echo(f"Error installing service: {e}", err=True)
+        sys.exit(1)
+
+
+@click.command("uninstall-service")
+@click.option(
+    "--keep-data",
+    is_flag=True,
+    help="Keep user data and logs (only remove service)"
+)
+@click.confirmation_option(
+    prompt="Are you sure you want to uninstall the BBMesh service?"
+)
+def uninstall_service(keep_data: bool):
+    """Uninstall BBMesh systemd service"""
+    try:
+        # Check if running as root
+        if os.geteuid() != 0:
+            click.echo("Error: This command must be run as root (use sudo)", err=True)
+            sys.exit(1)
+        
+        service_name = "bbmesh"
+        service_user = "bbmesh"
+        install_dir = "/opt/bbmesh"
+        log_dir = "/var/log/bbmesh"
+        data_dir = "/var/lib/bbmesh"
+        
+        # Stop and disable service
+        click.echo("Stopping and disabling service...")
+        subprocess.run(["systemctl", "stop", service_name], check=False)
+        subprocess.run(["systemctl", "disable", service_name], check=False)
+        
+        # Remove service file
+        service_file = f"/etc/systemd/system/{service_name}.service"
+        try:
+            os.remove(service_file)
+            click.echo(f"Removed service file: {service_file}")
+        except FileNotFoundError:
+            pass
+        
+        # Remove logrotate configuration
+        logrotate_file = f"/etc/logrotate.d/{service_name}"
+        try:
+            os.remove(logrotate_file)
+            click.echo(f"Removed logrotate config: {logrotate_file}")
+        except FileNotFoundError:
+            pass
+        
+        # Look the service user up once; crontab and userdel are skipped
+        # entirely when it doesn't exist (e.g. a partial install)
+        try:
+            pwd.getpwnam(service_user)
+            user_exists = True
+        except KeyError:
+            user_exists = False
+        
+        # Remove cron jobs
+        if user_exists:
+            try:
+                subprocess.run(["crontab", "-r", "-u", service_user], check=False)
+                click.echo("Removed cron jobs")
+            except Exception:
+                pass
+        
+        # Remove installation directory
+        try:
+            shutil.rmtree(install_dir)
+            click.echo(f"Removed installation directory: {install_dir}")
+        except FileNotFoundError:
+            pass
+        
+        if not keep_data:
+            # Remove data and logs
+            try:
+                shutil.rmtree(data_dir)
+                click.echo(f"Removed data directory: {data_dir}")
+            except FileNotFoundError:
+                pass
+            
+            try:
+                shutil.rmtree(log_dir)
+                click.echo(f"Removed log directory: {log_dir}")
+            except FileNotFoundError:
+                pass
+            
+            # Remove user
+            if user_exists:
+                try:
+                    subprocess.run(["userdel", "-r", service_user], check=False)
+                    click.echo(f"Removed user: {service_user}")
+                except Exception:
+                    pass
+        else:
+            click.echo(f"Kept data in: {data_dir}")
+            click.echo(f"Kept logs in: {log_dir}")
+            click.echo(f"Kept user: {service_user}")
+        
+        # Reload systemd
+        subprocess.run(["systemctl", "daemon-reload"], check=False)
+        
+        click.echo("✓ BBMesh service uninstalled successfully!")
+        
+    except Exception as e:
+        click.echo(f"Error uninstalling service: {e}", err=True)
+        sys.exit(1)
+
+
+def _process_info(pid: int):
+    """
+    Read memory use and command line of a process from /proc
+
+    Reads /proc directly rather than forking ps.
+
+    Returns:
+        (rss, cmdline) tuple, or None if the process is gone or unreadable
+    """
+    pid_dir = Path("/proc") / str(pid)
+    try:
+        args = (pid_dir / "cmdline").read_bytes().split(b"\0")
+
+        rss = "?"
+        for line in (pid_dir / "status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                rss = "".join(line.split()[1:])
+                break
+    except OSError:
+        return None
+
+    cmdline = b" ".join(arg for arg in args if arg).decode(errors="replace")
+    return rss, cmdline
+
+
+@click.command("service-status")
+def service_status():
+    """Check BBMesh service status and health"""
+    try:
+        service_name = "bbmesh"
+        
+        # Query load, active and enablement state and the main PID in a
+        # single systemctl call
+        result = subprocess.run(
+            ["systemctl", "show", service_name,
+             "--property=LoadState,ActiveState,UnitFileState,MainPID"],
+            capture_output=True,
+            text=True
+        )
+        properties = dict(
+            line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+        )
+        
+        # systemd knows every unit directory, so let it say whether the unit exists
+        if properties.get("LoadState", "not-found") == "not-found":
+            click.echo("BBMesh service is not installed.")
+            click.echo("Use 'bbmesh install-service' to install it.")
+            sys.exit(1)
+        
+        is_active = properties.get("ActiveState", "unknown")
+        is_enabled = properties.get("UnitFileState", "unknown")
+        
+        # Display status
+        click.echo("BBMesh Service Status")
+        click.echo("=" * 50)
+        click.echo(f"Active: {is_active}")
+        click.echo(f"Enabled: {is_enabled}")
+        click.echo()
+        
+        # Show recent logs
+        click.echo("Recent logs:")
+        click.echo("-" * 20)
+        log_result = subprocess.run(
+            ["journalctl", "-u", service_name, "--lines=10", "--no-pager"],
+            capture_output=True,
+            text=True
+        )
+        
+        if log_result.returncode == 0:
+            click.echo(log_result.stdout)
+        else:
+            click.echo("Could not retrieve logs")
+        
+        # Check process info if active
+        if is_active == "active":
+            click.echo("Process information:")
+            click.echo("-" * 20)
+            # systemd tracks the service's own process, so there's no need
+            # to guess it from command lines
+            main_pid = int(properties.get("MainPID", "0") or 0)
+            info = _process_info(main_pid) if main_pid else None
+            if info:
+                rss, cmdline = info
+                click.echo(f"{'PID':<8} {'RSS':<10} COMMAND")
+                click.echo(f"{main_pid:<8} {rss:<10} {cmdline}")
+            else:
+                click.echo("No running bbmesh process found")
+        
+        # Service management commands
+        click.echo()
+        click.echo("Service management commands:")
+        click.echo("  sudo systemctl start bbmesh      # Start service")
+        click.echo("  sudo systemctl stop bbmesh       # Stop service")
+        click.echo("  sudo systemctl restart bbmesh    # Restart service")
+        click.echo("  journalctl -u bbmesh -f          # Follow logs")
+        
+    except Exception as e:
+        click.echo(f"Error checking service status: {e}", err=True)
+        sys.exit(1)
+
+
+@click.command("health-check")
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True, path_type=Path),
+    default="config/bbmesh.yaml",
+    help="Configuration file path",
+)
+def health_check(config: Path):
+    """Perform health check on BBMesh system"""
+    from .core.config import Config
+
+    try:
+        click.echo("BBMesh Health Check")
+        click.echo("=" * 50)
+        
+        health_status = True
+        
+        # Check configuration
+        click.echo("1. Configuration Check...")
+        try:
+            cfg = Config.load(config)
+            click.echo("   ✓ Configuration file valid")
+        except Exception as e:
+            click.echo(f"   ✗ Configuration error: {e}")
+            health_status = False
+        
+        # Check serial port access
+        click.echo("2. Serial Port Check...")
+        try:
+            if hasattr(cfg, 'meshtastic') and hasattr(cfg.meshtastic, 'serial'):
+                port = cfg.meshtastic.serial.port
+                try:
+                    # One stat answers both existence and device type
+                    port_stat = os.stat(port)
+                except FileNotFoundError:
+                    click.echo(f"   ✗ Serial port {port} does not exist")
+                    health_status = False
+                else:
+                    if not stat.S_ISCHR(port_stat.st_mode):
+                        click.echo(f"   ⚠ Serial port {port} is not a character device")
+                    
+                    # Check if we can access the port
+                    if os.access(port, os.R_OK | os.W_OK):
+                        click.echo(f"   ✓ Serial port {port} accessible")
+                    else:
+                        click.echo(f"   ✗ Serial port {port} not accessible (check permissions)")
+                        health_status = False
+            else:
+                click.echo("   ⚠ Serial port not configured")
+        except Exception as e:
+            click.echo(f"   ✗ Serial port check failed: {e}")
+            health_status = False
+        
+        # Check disk space
+        click.echo("3. Disk Space Check...")
+        try:
+            # Check current directory (only free space is needed, so skip
+            # shutil.disk_usage's total/used computation)
+            fs_stat = os.statvfs(".")
+            free_gb = (fs_stat.f_bavail * fs_stat.f_frsize) // (1024**3)
+            
+            if free_gb > 1:
+                click.echo(f"   ✓ Sufficient disk space ({free_gb}GB free)")
+            else:
+                click.echo(f"   ⚠ Low disk space ({free_gb}GB free)")
+                
+        except Exception as e:
+            click.echo(f"   ✗ Disk space check failed: {e}")
+        
+        # Check Python environment
+        click.echo("4. Python Environment Check...")
+        # find_spec locates the packages without executing them
+        if importlib.util.find_spec("meshtastic") is not None:
+            click.echo("   ✓ Meshtastic library available")
+        else:
+            click.echo("   ✗ Meshtastic library not installed")
+            health_status = False
+        
+        if importlib.util.find_spec("yaml") is not None:
+            click.echo("   ✓ YAML library available")
+        else:
+            click.echo("   ✗ YAML library not installed")
+            health_status = False
+        
+        # Overall status
+        click.echo()
+        if health_status:
+            click.echo("✓ Overall health status: GOOD")
+            sys.exit(0)
+        else:
+            click.echo("✗ Overall health status: ISSUES DETECTED")
+            sys.exit(1)
+            
+    except Exception as e:
+        click.echo(f"Error during health check: {e}", err=True)
+        sys.exit(1)
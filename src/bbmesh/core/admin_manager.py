@@ -5,16 +5,60 @@ This module manages admin node registration (via YAML config or PSK) and
 sends notifications to admin nodes when new mesh nodes are detected.
 """
 
+import hmac
+from collections import namedtuple
+import queue
 import sqlite3
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from contextlib import contextmanager
 
 from ..utils.logger import BBMeshLogger
 
 
+# Per-connection tuning applied to every pooled connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=67108864",
+    "PRAGMA cache_size=-8000",
+)
+
+# How long active admin IDs are reused before re-reading them, to pick up
+# changes made by other processes (e.g. bbmesh-nodes)
+ADMIN_CACHE_TTL = 60.0
+
+# Notification timestamps are written in batches of up to this many rows,
+# collected for at most this many seconds
+WRITE_BATCH_SIZE = 64
+WRITE_BATCH_INTERVAL = 0.2
+
+# Sentinel telling the background writer to stop
+_STOP_WRITER = object()
+
+# Active admin as returned by get_active_admins; _asdict() gives a plain dict
+AdminRow = namedtuple(
+    'AdminRow',
+    'node_id node_name registration_method registered_at last_notification_at'
+)
+
+DEFAULT_NOTIFICATION_FORMAT = '🆕 {node_name} ({node_id})'
+
+
+def _timestamp() -> str:
+    """
+    Current local time in the format sqlite3's datetime adapter writes
+    
+    Binding the string directly skips the per-value adapter, which is
+    deprecated from Python 3.12.
+    """
+    return datetime.now().isoformat(sep=' ')
+
+
 class AdminManager:
     """
     Manages admin node registration and notifications
@@ -34,53 +78,151 @@ class AdminManager:
             mesh_interface: MeshtasticInterface instance for sending messages
         """
         self.db_path = Path(db_path)
-        self.config = config
         self.mesh_interface = mesh_interface
         self.logger = BBMeshLogger(__name__)
         self._lock = threading.Lock()
         
-        # Extract configuration
-        self.notification_format = config.get('notification_format', '🆕 {node_name} ({node_id})')
-        self.admin_psk = config.get('admin_psk')
-        self.psk_enabled = config.get('psk_enabled', True)
+        # Connection pool: one writer guarded by _lock, one reader per thread
+        self._local = threading.local()
+        self._reader_conns: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        
+        # Active admin IDs, dropped whenever admin membership changes. The
+        # generation is bumped on every drop so a read that raced with one
+        # doesn't put its stale result back into the cache.
+        self._admin_id_cache: Optional[List[str]] = None
+        self._admin_cache_stamp = 0.0
+        self._admin_cache_generation = 0
+        
+        # Extract configuration once; the config dict itself isn't kept
+        notification_format = config.get('notification_format', DEFAULT_NOTIFICATION_FORMAT)
+        try:
+            # Validate once so a broken template is reported at startup
+            notification_format.format(node_name='', node_id='')
+        except (KeyError, IndexError, ValueError, AttributeError) as e:
+            self.logger.error(f"Invalid notification_format {notification_format!r}: {e!r}, using default")
+            notification_format = DEFAULT_NOTIFICATION_FORMAT
+        self._notification_format = notification_format
+        admin_psk = config.get('admin_psk')
+        self._admin_psk_bytes = admin_psk.encode('utf-8') if admin_psk else None
+        self._psk_enabled = config.get('psk_enabled', True)
         
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Initialize database
+        # Open the writer and initialize database
+        self._writer_conn = self._open_connection()
         self.initialize_database()
         
+        # Notification timestamps are recorded off the notification path
+        self._write_queue: queue.Queue = queue.Queue()
+        self._write_thread = threading.Thread(target=self._write_loop, name="admin-db-writer", daemon=True)
+        self._write_thread.start()
+        
         # Load YAML-configured admins
         yaml_admins = config.get('admin_nodes', [])
         if yaml_admins:
             self.load_config_admins(yaml_admins)
         
-        self.logger.info(f"AdminManager initialized: {len(yaml_admins)} config admins, PSK={'enabled' if self.psk_enabled else 'disabled'}")
+        self.logger.info(f"AdminManager initialized: {len(yaml_admins)} config admins, PSK={'enabled' if self._psk_enabled else 'disabled'}")
+    
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a pooled database connection
+        
+        Connections run in autocommit mode; transactions are managed
+        explicitly by _get_writer().
+        
+        Args:
+            read_only: Whether to refuse writes on this connection
+            
+        Returns:
+            sqlite3.Connection: Database connection
+        """
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+        return conn
     
     @contextmanager
-    def _get_connection(self):
+    def _get_reader(self):
         """
-        Context manager for database connections
+        Context manager for a read-only connection owned by the calling thread
         
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._open_connection(read_only=True)
+            with self._pool_lock:
+                self._reader_conns.append(conn)
         try:
             yield conn
-            conn.commit()
         except Exception as e:
-            conn.rollback()
             self.logger.error(f"Database error: {e}")
             raise
-        finally:
-            conn.close()
+    
+    @contextmanager
+    def _get_writer(self, changes_admins: bool = False):
+        """
+        Context manager for the shared writer connection
+        
+        Holds the write lock and wraps the block in a transaction that is
+        committed on success and rolled back on error.
+        
+        Args:
+            changes_admins: Whether the block may change which admins are
+                active; the admin ID cache is dropped once it commits
+            
+        Yields:
+            sqlite3.Connection: Database connection
+        """
+        with self._lock:
+            conn = self._writer_conn
+            conn.execute("BEGIN")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                self.logger.error(f"Database error: {e}")
+                raise
+            finally:
+                if changes_admins:
+                    self._admin_id_cache = None
+                    self._admin_cache_generation += 1
+    
+    def close(self) -> None:
+        """Stop background work and close all pooled database connections"""
+        # Let the writer flush queued timestamps before its connection closes
+        self._write_queue.put(_STOP_WRITER)
+        self._write_thread.join()
+        
+        with self._pool_lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns.clear()
+        self._local = threading.local()
+        
+        with self._lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
     
     def initialize_database(self) -> None:
         """Create admin_nodes table if it doesn't exist"""
         try:
-            with self._get_connection() as conn:
+            # WAL lets readers proceed while a write is in progress; the
+            # journal mode is persistent and can't change inside a transaction
+            with self._lock:
+                self._writer_conn.execute("PRAGMA journal_mode=WAL")
+            
+            with self._get_writer() as conn:
                 cursor = conn.cursor()
                 
                 # Create admin_nodes table
@@ -96,11 +238,17 @@ class AdminManager:
                     )
                 """)
                 
-                # Create index for active admins
+                # Partial covering index for active admin lookups; only
+                # active rows are indexed, so it supersedes the older
+                # idx_active_admins and idx_admins_active_nodeid. is_active
+                # is included so the planner can answer from the index alone
                 cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_active_admins 
-                    ON admin_nodes(is_active)
+                    CREATE INDEX IF NOT EXISTS idx_admins_active_partial 
+                    ON admin_nodes(registered_at DESC, node_id, is_active)
+                    WHERE is_active = 1
                 """)
+                cursor.execute("DROP INDEX IF EXISTS idx_active_admins")
+                cursor.execute("DROP INDEX IF EXISTS idx_admins_active_nodeid")
                 
                 self.logger.info("Admin nodes database initialized")
                 
@@ -116,41 +264,24 @@ class AdminManager:
             admin_node_ids: List of admin node IDs from config
         """
         try:
-            with self._lock:
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    now = datetime.now()
-                    
-                    for node_id in admin_node_ids:
-                        if not node_id:
-                            continue
-                        
-                        # Check if already exists
-                        cursor.execute(
-                            "SELECT node_id FROM admin_nodes WHERE node_id = ?",
-                            (node_id,)
-                        )
-                        
-                        if cursor.fetchone() is None:
-                            # Insert new config admin
-                            cursor.execute("""
-                                INSERT INTO admin_nodes 
-                                (node_id, node_name, registration_method, registered_at, is_active)
-                                VALUES (?, ?, 'config', ?, 1)
-                            """, (node_id, 'Config Admin', now))
-                            
-                            self.logger.info(f"Registered config admin: {node_id}")
-                        else:
-                            # Update existing to ensure it's active and method is 'config'
-                            cursor.execute("""
-                                UPDATE admin_nodes 
-                                SET registration_method = 'config',
-                                    is_active = 1
-                                WHERE node_id = ?
-                            """, (node_id,))
-                            
-                            self.logger.debug(f"Updated config admin: {node_id}")
-                    
+            with self._get_writer(changes_admins=True) as conn:
+                cursor = conn.cursor()
+                now = _timestamp()
+                rows = [(node_id, 'Config Admin', now) for node_id in admin_node_ids if node_id]
+                
+                # Insert new config admins, or ensure existing ones are
+                # active and their method is 'config'
+                cursor.executemany("""
+                    INSERT INTO admin_nodes 
+                    (node_id, node_name, registration_method, registered_at, is_active)
+                    VALUES (?, ?, 'config', ?, 1)
+                    ON CONFLICT(node_id) DO UPDATE
+                    SET registration_method = 'config',
+                        is_active = 1
+                """, rows)
+                
+                self.logger.debug(f"Loaded {len(rows)} config admins")
+                
         except Exception as e:
             self.logger.error(f"Error loading config admins: {e}")
     
@@ -166,78 +297,64 @@ class AdminManager:
         Returns:
             True if registration successful, False otherwise
         """
-        if not self.psk_enabled:
+        if not self._psk_enabled:
             self.logger.warning(f"PSK registration disabled, rejected attempt from {node_id}")
             return False
         
-        if not self.admin_psk:
+        if not self._admin_psk_bytes:
             self.logger.error("Admin PSK not configured, cannot validate registration")
             return False
         
-        # Validate PSK
-        if provided_psk != self.admin_psk:
+        # Validate PSK in constant time
+        if not hmac.compare_digest(provided_psk.encode('utf-8'), self._admin_psk_bytes):
             self.logger.warning(f"Invalid PSK from {node_id} ({node_name})")
             return False
         
         try:
-            with self._lock:
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    now = datetime.now()
-                    
-                    # Check if already exists
-                    cursor.execute(
-                        "SELECT node_id, registration_method FROM admin_nodes WHERE node_id = ?",
-                        (node_id,)
-                    )
-                    result = cursor.fetchone()
-                    
-                    if result:
-                        # Update existing admin
-                        cursor.execute("""
-                            UPDATE admin_nodes 
-                            SET node_name = ?,
-                                registration_method = 'psk',
-                                registered_at = ?,
-                                is_active = 1
-                            WHERE node_id = ?
-                        """, (node_name, now, node_id))
-                        
-                        self.logger.info(f"Re-registered admin via PSK: {node_name} ({node_id})")
-                    else:
-                        # Insert new PSK admin
-                        cursor.execute("""
-                            INSERT INTO admin_nodes 
-                            (node_id, node_name, registration_method, registered_at, is_active)
-                            VALUES (?, ?, 'psk', ?, 1)
-                        """, (node_id, node_name, now))
-                        
-                        self.logger.info(f"Registered new admin via PSK: {node_name} ({node_id})")
-                    
-                    return True
+            with self._get_writer(changes_admins=True) as conn:
+                cursor = conn.cursor()
+                now = _timestamp()
+                
+                # Insert new PSK admin, or re-register an existing one
+                cursor.execute("""
+                    INSERT INTO admin_nodes 
+                    (node_id, node_name, registration_method, registered_at, is_active)
+                    VALUES (?, ?, 'psk', ?, 1)
+                    ON CONFLICT(node_id) DO UPDATE
+                    SET node_name = excluded.node_name,
+                        registration_method = 'psk',
+                        registered_at = excluded.registered_at,
+                        is_active = 1
+                """, (node_id, node_name, now))
+                
+                self.logger.info(f"Registered admin via PSK: {node_name} ({node_id})")
+                
+                return True
                     
         except Exception as e:
             self.logger.error(f"Error registering admin via PSK: {e}")
             return False
     
-    def get_active_admins(self) -> List[Dict[str, Any]]:
+    def get_active_admins(self) -> List[AdminRow]:
         """
         Get list of active admin nodes
         
         Returns:
-            List of dictionaries with admin information
+            List of AdminRow tuples with admin information
         """
         try:
-            with self._get_connection() as conn:
+            with self._get_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT * FROM admin_nodes 
+                    SELECT node_id, node_name, registration_method,
+                           registered_at, last_notification_at
+                    FROM admin_nodes 
                     WHERE is_active = 1
                     ORDER BY registered_at DESC
                 """)
                 results = cursor.fetchall()
                 
-                return [dict(row) for row in results]
+                return [AdminRow._make(row) for row in results]
                 
         except Exception as e:
             self.logger.error(f"Error getting active admins: {e}")
@@ -250,8 +367,32 @@ class AdminManager:
         Returns:
             List of node IDs
         """
-        admins = self.get_active_admins()
-        return [admin['node_id'] for admin in admins]
+        cached = self._admin_id_cache
+        if cached is not None and time.monotonic() - self._admin_cache_stamp < ADMIN_CACHE_TTL:
+            return list(cached)
+        
+        generation = self._admin_cache_generation
+        try:
+            with self._get_reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT node_id FROM admin_nodes 
+                    WHERE is_active = 1
+                    ORDER BY registered_at DESC
+                """)
+                admin_ids = [row[0] for row in cursor.fetchall()]
+                
+        except Exception as e:
+            self.logger.error(f"Error getting active admin IDs: {e}")
+            return []
+        
+        # Invalidation happens under the write lock, so checking the
+        # generation under it too keeps a stale list out of the cache
+        with self._lock:
+            if self._admin_cache_generation == generation:
+                self._admin_id_cache = admin_ids
+                self._admin_cache_stamp = time.monotonic()
+        return list(admin_ids)
     
     def send_new_node_notification(self, node_id: str, node_name: str) -> None:
         """
@@ -270,13 +411,13 @@ class AdminManager:
                 return
             
             # Format notification message
-            message = self.notification_format.format(
+            message = self._notification_format.format(
                 node_name=node_name,
                 node_id=node_id
             )
             
             # Send to each admin
-            success_count = 0
+            notified: List[str] = []
             for admin_id in admin_ids:
                 try:
                     # Send direct message to admin
@@ -287,40 +428,67 @@ class AdminManager:
                     )
                     
                     if success:
-                        success_count += 1
+                        notified.append(admin_id)
                         self.logger.debug(f"Sent new node notification to admin {admin_id}")
-                        
-                        # Update last notification time
-                        self._update_last_notification(admin_id)
                     else:
                         self.logger.warning(f"Failed to send notification to admin {admin_id}")
                         
                 except Exception as e:
                     self.logger.error(f"Error sending notification to admin {admin_id}: {e}")
             
+            # Queue last notification time for every admin reached
+            now = _timestamp()
+            for admin_id in notified:
+                self._write_queue.put((now, admin_id))
+            
             self.logger.info(
                 f"Sent new node notification for {node_name} ({node_id}) "
-                f"to {success_count}/{len(admin_ids)} admins"
+                f"to {len(notified)}/{len(admin_ids)} admins"
             )
             
         except Exception as e:
             self.logger.error(f"Error in send_new_node_notification: {e}")
     
-    def _update_last_notification(self, admin_id: str) -> None:
+    def _write_loop(self) -> None:
+        """Drain queued notification timestamps and write them in batches"""
+        stopping = False
+        while not stopping:
+            item = self._write_queue.get()
+            if item is _STOP_WRITER:
+                break
+            
+            rows = [item]
+            deadline = time.monotonic() + WRITE_BATCH_INTERVAL
+            while len(rows) < WRITE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._write_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP_WRITER:
+                    stopping = True
+                    break
+                rows.append(item)
+            
+            self._update_last_notification(rows)
+    
+    def _update_last_notification(self, rows: List[Tuple[str, str]]) -> None:
         """
-        Update the last notification timestamp for an admin
+        Update the last notification timestamp for a batch of admins
         
         Args:
-            admin_id: Admin node ID
+            rows: (notification time, admin node ID) pairs
         """
         try:
-            with self._get_connection() as conn:
+            with self._get_writer() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
+                cursor.executemany("""
                     UPDATE admin_nodes 
                     SET last_notification_at = ?
                     WHERE node_id = ?
-                """, (datetime.now(), admin_id))
+                """, rows)
                 
         except Exception as e:
             self.logger.error(f"Error updating last notification time: {e}")
@@ -336,21 +504,20 @@ class AdminManager:
             True if deactivated, False if not found or error
         """
         try:
-            with self._lock:
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        UPDATE admin_nodes 
-                        SET is_active = 0
-                        WHERE node_id = ?
-                    """, (node_id,))
-                    
-                    if cursor.rowcount > 0:
-                        self.logger.info(f"Deactivated admin: {node_id}")
-                        return True
-                    else:
-                        self.logger.warning(f"Admin not found for deactivation: {node_id}")
-                        return False
+            with self._get_writer(changes_admins=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE admin_nodes 
+                    SET is_active = 0
+                    WHERE node_id = ?
+                """, (node_id,))
+                
+                if cursor.rowcount > 0:
+                    self.logger.info(f"Deactivated admin: {node_id}")
+                    return True
+                else:
+                    self.logger.warning(f"Admin not found for deactivation: {node_id}")
+                    return False
                         
         except Exception as e:
             self.logger.error(f"Error deactivating admin {node_id}: {e}")
@@ -367,21 +534,20 @@ class AdminManager:
             True if activated, False if not found or error
         """
         try:
-            with self._lock:
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        UPDATE admin_nodes 
-                        SET is_active = 1
-                        WHERE node_id = ?
-                    """, (node_id,))
-                    
-                    if cursor.rowcount > 0:
-                        self.logger.info(f"Activated admin: {node_id}")
-                        return True
-                    else:
-                        self.logger.warning(f"Admin not found for activation: {node_id}")
-                        return False
+            with self._get_writer(changes_admins=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE admin_nodes 
+                    SET is_active = 1
+                    WHERE node_id = ?
+                """, (node_id,))
+                
+                if cursor.rowcount > 0:
+                    self.logger.info(f"Activated admin: {node_id}")
+                    return True
+                else:
+                    self.logger.warning(f"Admin not found for activation: {node_id}")
+                    return False
                         
         except Exception as e:
             self.logger.error(f"Error activating admin {node_id}: {e}")
@@ -398,20 +564,19 @@ class AdminManager:
             True if removed, False if not found or error
         """
         try:
-            with self._lock:
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        DELETE FROM admin_nodes 
-                        WHERE node_id = ?
-                    """, (node_id,))
-                    
-                    if cursor.rowcount > 0:
-                        self.logger.info(f"Removed admin: {node_id}")
-                        return True
-                    else:
-                        self.logger.warning(f"Admin not found for removal: {node_id}")
-                        return False
+            with self._get_writer(changes_admins=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    DELETE FROM admin_nodes 
+                    WHERE node_id = ?
+                """, (node_id,))
+                
+                if cursor.rowcount > 0:
+                    self.logger.info(f"Removed admin: {node_id}")
+                    return True
+                else:
+                    self.logger.warning(f"Admin not found for removal: {node_id}")
+                    return False
                         
         except Exception as e:
             self.logger.error(f"Error removing admin {node_id}: {e}")
@@ -425,14 +590,15 @@ class AdminManager:
             Dictionary with counts
         """
         try:
-            with self._get_connection() as conn:
+            with self._get_reader() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("SELECT COUNT(*) as count FROM admin_nodes WHERE is_active = 1")
-                active = cursor.fetchone()['count']
-                
-                cursor.execute("SELECT COUNT(*) as count FROM admin_nodes WHERE is_active = 0")
-                inactive = cursor.fetchone()['count']
+                cursor.execute("""
+                    SELECT COALESCE(SUM(is_active = 1), 0) AS active,
+                           COALESCE(SUM(is_active = 0), 0) AS inactive
+                    FROM admin_nodes
+                """)
+                active, inactive = cursor.fetchone()
                 
                 return {
                     'active': active,
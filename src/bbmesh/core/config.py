@@ -2,12 +2,103 @@
 Configuration management for BBMesh
 """
 
-from dataclasses import dataclass, field
+import copy
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import yaml
 
+from ..utils.slots import add_slots
 
+try:
+    # libyaml's C parser and emitter are much faster than the pure-Python ones
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+# Suffix of the JSON sidecar holding a pre-parsed copy of a YAML config
+CACHE_SUFFIX = ".cache.json"
+
+# Set to "0" to neither read nor write the JSON sidecar
+CACHE_ENV_VAR = "BBMESH_CONFIG_CACHE"
+
+# Logging levels accepted by validate_service_deployment, in display order
+_LOG_LEVEL_NAMES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LEVELS = frozenset(_LOG_LEVEL_NAMES)
+
+
+def _read_cache_file(cache_path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """
+    Read a JSON config cache if it matches the YAML file's mtime and size
+
+    The first line is a header recording the source file's stat; the
+    remainder is the parsed configuration.
+    """
+    try:
+        with open(cache_path, 'r') as f:
+            header = json.loads(f.readline())
+            if header.get("mtime_ns") != mtime_ns or header.get("size") != size:
+                return None
+            return json.load(f)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_cache_file(cache_path: str, mtime_ns: int, size: int, data: Dict[str, Any]) -> None:
+    """Atomically write a JSON config cache, ignoring any failure"""
+    try:
+        body = json.dumps(data)
+        # Only cache data that survives a JSON round trip unchanged
+        if json.loads(body) != data:
+            return
+        header = json.dumps({"mtime_ns": mtime_ns, "size": size})
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".",
+                                        prefix=".bbmesh-config-")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(header + "\n" + body)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        # Read-only config directories and non-JSON values just skip caching
+        pass
+
+
+@lru_cache(maxsize=8)
+def _read_config_data(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML configuration file
+
+    Results are cached in-process per (path, mtime, size) and on disk in a
+    JSON sidecar, so repeated loads of an unchanged file skip the YAML
+    parse. The sidecar can be turned off by setting BBMESH_CONFIG_CACHE=0.
+    Callers must not mutate the returned dict.
+    """
+    use_sidecar = os.environ.get(CACHE_ENV_VAR, "1") != "0"
+    cache_path = path + CACHE_SUFFIX
+    if use_sidecar:
+        data = _read_cache_file(cache_path, mtime_ns, size)
+        if data is not None:
+            return data
+
+    # One read of the whole file; the C loader then parses from memory
+    # rather than pulling the stream in small chunks
+    data = yaml.load(Path(path).read_bytes(), Loader=_Loader) or {}
+
+    if use_sidecar:
+        _write_cache_file(cache_path, mtime_ns, size, data)
+    return data
+
+
+@add_slots
 @dataclass
 class SerialConfig:
     """Serial port configuration"""
@@ -20,6 +111,7 @@ class SerialConfig:
     remove_stale_locks: bool = True
 
 
+@add_slots
 @dataclass
 class MeshtasticConfig:
     """Meshtastic node configuration"""
@@ -30,6 +122,7 @@ class MeshtasticConfig:
     direct_message_only: bool = False
 
 
+@add_slots
 @dataclass
 class LoggingConfig:
     """Logging configuration"""
@@ -41,6 +134,7 @@ class LoggingConfig:
     console_output: bool = True
 
 
+@add_slots
 @dataclass
 class ServerConfig:
     """Server configuration"""
@@ -59,6 +153,7 @@ class ServerConfig:
     auto_reconnect: bool = True  # Auto-reconnect on health check failure
 
 
+@add_slots
 @dataclass
 class MenuConfig:
     """Menu system configuration"""
@@ -68,6 +163,7 @@ class MenuConfig:
     prompt_suffix: str = " > "
 
 
+@add_slots
 @dataclass
 class PluginConfig:
     """Plugin system configuration"""
@@ -77,6 +173,7 @@ class PluginConfig:
     plugin_timeout: int = 30  # seconds
 
 
+@add_slots
 @dataclass
 class DatabaseConfig:
     """Database configuration"""
@@ -85,6 +182,7 @@ class DatabaseConfig:
     backup_interval: int = 3600  # seconds
 
 
+@add_slots
 @dataclass
 class NodeTrackingConfig:
     """Node tracking and admin notification configuration"""
@@ -97,6 +195,31 @@ class NodeTrackingConfig:
     psk_enabled: bool = True
 
 
+# Dataclass for each top-level configuration section
+_SECTION_CLASSES = {
+    "meshtastic": MeshtasticConfig,
+    "logging": LoggingConfig,
+    "server": ServerConfig,
+    "menu": MenuConfig,
+    "plugins": PluginConfig,
+    "database": DatabaseConfig,
+    "node_tracking": NodeTrackingConfig,
+}
+
+# Field names accepted by each configuration dataclass; unknown keys are ignored
+_FIELD_NAMES = {
+    cls: frozenset(f.name for f in fields(cls))
+    for cls in (SerialConfig, *_SECTION_CLASSES.values())
+}
+
+
+def _section_from_dict(section_cls, data: Dict[str, Any]):
+    """Build a configuration dataclass from the known keys of a dict"""
+    names = _FIELD_NAMES[section_cls]
+    return section_cls(**{key: value for key, value in data.items() if key in names})
+
+
+@add_slots
 @dataclass
 class Config:
     """Main BBMesh configuration"""
@@ -114,126 +237,42 @@ class Config:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_path, 'r') as f:
-            data = yaml.safe_load(f) or {}
+        st = config_path.stat()
+        data = _read_config_data(os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
         
-        return cls.from_dict(data)
+        # Config objects are mutable, so never hand out the cached data itself
+        return cls.from_dict(copy.deepcopy(data))
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
         """Create Config from dictionary"""
-        config = cls()
+        sections = {}
         
-        # Update configuration sections
-        if "meshtastic" in data:
-            meshtastic_data = data["meshtastic"]
-            if "serial" in meshtastic_data:
-                config.meshtastic.serial = SerialConfig(**meshtastic_data["serial"])
-            for key, value in meshtastic_data.items():
-                if key != "serial" and hasattr(config.meshtastic, key):
-                    setattr(config.meshtastic, key, value)
+        for name, section_cls in _SECTION_CLASSES.items():
+            if name not in data:
+                continue
+            section_data = data[name]
+            if section_cls is MeshtasticConfig and "serial" in section_data:
+                section_data = dict(section_data, serial=_section_from_dict(SerialConfig, section_data["serial"]))
+            sections[name] = _section_from_dict(section_cls, section_data)
         
-        if "logging" in data:
-            for key, value in data["logging"].items():
-                if hasattr(config.logging, key):
-                    setattr(config.logging, key, value)
-        
-        if "server" in data:
-            for key, value in data["server"].items():
-                if hasattr(config.server, key):
-                    setattr(config.server, key, value)
-        
-        if "menu" in data:
-            for key, value in data["menu"].items():
-                if hasattr(config.menu, key):
-                    setattr(config.menu, key, value)
-        
-        if "plugins" in data:
-            for key, value in data["plugins"].items():
-                if hasattr(config.plugins, key):
-                    setattr(config.plugins, key, value)
-        
-        if "database" in data:
-            for key, value in data["database"].items():
-                if hasattr(config.database, key):
-                    setattr(config.database, key, value)
-        
-        if "node_tracking" in data:
-            for key, value in data["node_tracking"].items():
-                if hasattr(config.node_tracking, key):
-                    setattr(config.node_tracking, key, value)
-        
-        return config
+        return cls(**sections)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert Config to dictionary"""
-        return {
-            "meshtastic": {
-                "serial": {
-                    "port": self.meshtastic.serial.port,
-                    "baudrate": self.meshtastic.serial.baudrate,
-                    "timeout": self.meshtastic.serial.timeout,
-                },
-                "node_id": self.meshtastic.node_id,
-                "monitored_channels": self.meshtastic.monitored_channels,
-                "response_channels": self.meshtastic.response_channels,
-                "direct_message_only": self.meshtastic.direct_message_only,
-            },
-            "logging": {
-                "level": self.logging.level,
-                "format": self.logging.format,
-                "file_path": self.logging.file_path,
-                "max_file_size": self.logging.max_file_size,
-                "backup_count": self.logging.backup_count,
-                "console_output": self.logging.console_output,
-            },
-            "server": {
-                "name": self.server.name,
-                "welcome_message": self.server.welcome_message,
-                "motd_file": self.server.motd_file,
-                "max_message_length": self.server.max_message_length,
-                "session_timeout": self.server.session_timeout,
-                "rate_limit_messages": self.server.rate_limit_messages,
-                "rate_limit_window": self.server.rate_limit_window,
-                "message_send_delay": self.server.message_send_delay,
-                "health_check_interval": self.server.health_check_interval,
-                "message_timeout_warning": self.server.message_timeout_warning,
-                "auto_reconnect": self.server.auto_reconnect,
-            },
-            "menu": {
-                "menu_file": self.menu.menu_file,
-                "timeout": self.menu.timeout,
-                "max_depth": self.menu.max_depth,
-                "prompt_suffix": self.menu.prompt_suffix,
-            },
-            "plugins": {
-                "plugin_dir": self.plugins.plugin_dir,
-                "plugin_config_file": self.plugins.plugin_config_file,
-                "enabled_plugins": self.plugins.enabled_plugins,
-                "plugin_timeout": self.plugins.plugin_timeout,
-            },
-            "database": {
-                "type": self.database.type,
-                "path": self.database.path,
-                "backup_interval": self.database.backup_interval,
-            },
-            "node_tracking": {
-                "enabled": self.node_tracking.enabled,
-                "new_node_threshold_days": self.node_tracking.new_node_threshold_days,
-                "notification_enabled": self.node_tracking.notification_enabled,
-                "notification_format": self.node_tracking.notification_format,
-                "admin_nodes": self.node_tracking.admin_nodes,
-                "admin_psk": self.node_tracking.admin_psk,
-                "psk_enabled": self.node_tracking.psk_enabled,
-            },
-        }
+        return asdict(self)
     
     def save(self, config_path: Path) -> None:
         """Save configuration to YAML file"""
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(config_path, 'w') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, indent=2)
+            yaml.dump(self.to_dict(), f, Dumper=_Dumper, default_flow_style=False, indent=2)
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget configuration files parsed by earlier load() calls"""
+        _read_config_data.cache_clear()
     
     @classmethod
     def create_default(cls) -> "Config":
@@ -250,26 +289,26 @@ class Config:
         errors = []
         
         # Check if paths are absolute for service deployment
-        if not Path(self.logging.file_path).is_absolute():
+        if not os.path.isabs(self.logging.file_path):
             errors.append("logging.file_path must be absolute for service deployment (e.g., /var/log/bbmesh/bbmesh.log)")
         
-        if not Path(self.database.path).is_absolute():
+        if not os.path.isabs(self.database.path):
             errors.append("database.path must be absolute for service deployment (e.g., /var/lib/bbmesh/bbmesh.db)")
         
         # Check if MOTD file path is absolute or None
-        if self.server.motd_file and not Path(self.server.motd_file).is_absolute():
+        if self.server.motd_file and not os.path.isabs(self.server.motd_file):
             errors.append("server.motd_file should be absolute for service deployment (e.g., /opt/bbmesh/config/motd.txt)")
         
         # Check if menu file path is absolute
-        if not Path(self.menu.menu_file).is_absolute():
+        if not os.path.isabs(self.menu.menu_file):
             errors.append("menu.menu_file should be absolute for service deployment (e.g., /opt/bbmesh/config/menus.yaml)")
         
         # Check if plugin config file path is absolute
-        if not Path(self.plugins.plugin_config_file).is_absolute():
+        if not os.path.isabs(self.plugins.plugin_config_file):
             errors.append("plugins.plugin_config_file should be absolute for service deployment (e.g., /opt/bbmesh/config/plugins.yaml)")
         
         # Check if plugin directory path is absolute
-        if not Path(self.plugins.plugin_dir).is_absolute():
+        if not os.path.isabs(self.plugins.plugin_dir):
             errors.append("plugins.plugin_dir should be absolute for service deployment (e.g., /opt/bbmesh/src/bbmesh/plugins)")
         
         # Validate serial port
@@ -277,9 +316,8 @@ class Config:
             errors.append("meshtastic.serial.port should be a device path (e.g., /dev/ttyUSB0)")
         
         # Check logging level
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if self.logging.level.upper() not in valid_levels:
-            errors.append(f"logging.level must be one of: {', '.join(valid_levels)}")
+        if self.logging.level.upper() not in _VALID_LEVELS:
+            errors.append(f"logging.level must be one of: {', '.join(_LOG_LEVEL_NAMES)}")
         
         # Check resource limits
         if self.server.max_message_length > 200:
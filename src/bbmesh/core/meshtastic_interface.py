@@ -2,25 +2,56 @@
 Meshtastic interface for BBMesh
 """
 
+import logging
 import time
+import random
 import threading
 import os
 import fcntl
+import pwd
+import shlex
 import subprocess
-from typing import Optional, Callable, Dict, Any, List
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Callable, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-import meshtastic
-import meshtastic.serial_interface
-from meshtastic import BROADCAST_ADDR
-from pubsub import pub
 import serial
 
+if TYPE_CHECKING:
+    import meshtastic.serial_interface
+
 from .config import MeshtasticConfig
+from ..utils.slots import add_slots
 from ..utils.logger import BBMeshLogger
 
 
+# portnum of the only packets _on_receive handles
+_TEXT_PORT = 'TEXT_MESSAGE_APP'
+
+# Numeric broadcast destinations (unsigned and signed forms of 0xFFFFFFFF)
+_BROADCAST_NUMS = frozenset((0xFFFFFFFF, -1))
+
+# (lowercase substring of a serial error, error, follow-up tip) when the
+# port cannot be opened during pre-connection checks
+_PORT_ACCESS_HINTS = (
+    ("permission denied",
+     "Permission denied - user may need to be added to dialout group",
+     "Try: sudo usermod -a -G dialout $USER && newgrp dialout"),
+    ("device or resource busy",
+     "Port is busy - another process may be using it",
+     "Check if another BBMesh instance or Meshtastic client is running"),
+)
+
+# (substring of a serial error, hint) for failures while connecting
+_SERIAL_ERROR_HINTS = (
+    ("Permission denied", "Serial permission error - check user permissions"),
+    ("No such file or directory", "Serial port not found - device may be disconnected"),
+    ("Device or resource busy", "Serial port busy - close other applications using the port"),
+)
+
+
+@add_slots
 @dataclass
 class MeshMessage:
     """Represents a received Meshtastic message"""
@@ -28,36 +59,126 @@ class MeshMessage:
     sender_name: str
     channel: int
     text: str
-    timestamp: datetime
+    timestamp: float  # time.time() seconds when the message was received
     is_direct: bool
     hop_limit: int
     snr: float
     rssi: int
     to_node: Optional[str] = None
 
+    @property
+    def received_at(self) -> datetime:
+        """Local time the message was received"""
+        return datetime.fromtimestamp(self.timestamp)
+
+
+class ExponentialBackoff:
+    """
+    Jittered exponential delay between retries
+    
+    The first failure waits min_delay; each further failure multiplies the
+    previous delay up to max_delay. A random +/- jitter fraction keeps
+    several nodes restarting together from retrying in lockstep.
+    """
+    
+    def __init__(self, min_delay: float = 0.25, max_delay: float = 5.0,
+                 multiplier: float = 2.0, jitter: float = 0.1):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._last = 0.0
+    
+    def on_failure(self) -> float:
+        """Record a failure and return how long to wait before retrying"""
+        if self._last:
+            self._last = min(self._last * self.multiplier, self.max_delay)
+        else:
+            self._last = self.min_delay
+        return max(0.0, self._last + random.uniform(-self.jitter, self.jitter) * self._last)
+    
+    def on_success(self) -> None:
+        """Start again from min_delay after the next failure"""
+        self._last = 0.0
+
 
 class MeshtasticInterface:
     """
     Interface to Meshtastic node via serial connection
     """
     
+    # Sender display names are reused for this long, for at most this many nodes
+    NAME_CACHE_TTL = 60.0
+    NAME_CACHE_SIZE = 256
+    
+    # Appended to message parts that still exceed the limit after splitting
+    TRUNCATION_SUFFIX = "..."
+    
+    # pubsub topic for TEXT_MESSAGE_APP packets only; subscribing to the
+    # parent "meshtastic.receive" would also deliver position, telemetry,
+    # routing and node info packets that _on_receive throws away
+    RECEIVE_TOPIC = "meshtastic.receive.text"
+    
+    # NODEINFO_APP packets, which carry a node's (possibly changed) names
+    NODE_INFO_TOPIC = "meshtastic.receive.user"
+    
+    # Directories that may hold UUCP-style LCK..<device> port lock files
+    LOCK_DIRS = ("/var/lock", "/tmp", "/var/run/lock")
+    
     def __init__(self, config: MeshtasticConfig, message_send_delay: float = 1.0, max_message_length: int = 200):
         self.config = config
+        self._monitored = frozenset(config.monitored_channels)  # Checked for every received broadcast
         self.message_send_delay = message_send_delay
         self.max_message_length = max_message_length
+        self._truncate_at = max_message_length - len(self.TRUNCATION_SUFFIX)
         self.logger = BBMeshLogger(__name__)
-        self.interface: Optional[meshtastic.serial_interface.SerialInterface] = None
+        self.interface: Optional["meshtastic.serial_interface.SerialInterface"] = None
         self.node_info: Dict[str, Any] = {}
         self.local_node_id: Optional[str] = None
+        self._local_node_num: Optional[int] = None  # local_node_id parsed for per-packet comparisons
         self.connected = False
-        self.message_callbacks: List[Callable[[MeshMessage], None]] = []
+        # Replaced (never mutated) under _cb_lock so _on_receive can iterate without locking
+        self.message_callbacks: Tuple[Callable[[MeshMessage], None], ...] = ()
+        self._cb_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._connection_lock = threading.Lock()  # Prevent concurrent connection attempts
+        self._send_lock = threading.Lock()  # Serialize radio sends from concurrent callers
         self._last_message_time: float = 0.0  # Track last message send time for delay enforcement
 
         # Health monitoring attributes
-        self.last_received_message_time: Optional[datetime] = None  # Track when we last received a message
+        self.last_received_message_time: Optional[float] = None  # time.time() of the last received message
         self.message_timeout: int = 1800  # 30 minutes - warn if no messages received
+
+        # node_id -> (resolved at, display name), oldest first
+        self._name_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+        # Meshtastic and pubsub are imported on first connect (see _import_meshtastic)
+        self._serial_interface_cls = None
+        self._pub = None
+        self._broadcast_addr: Optional[str] = None
+        
+    def _import_meshtastic(self) -> None:
+        """
+        Import the Meshtastic stack on first use
+        
+        meshtastic pulls in protobuf and friends, so importing it is deferred
+        until a connection is actually made rather than when this module loads.
+        """
+        if self._pub is not None:
+            return
+        
+        import meshtastic.serial_interface
+        from meshtastic import BROADCAST_ADDR
+        from pubsub import pub
+        
+        self._serial_interface_cls = meshtastic.serial_interface.SerialInterface
+        self._broadcast_addr = BROADCAST_ADDR
+        self._pub = pub
+        
+        # Subscribed once for the life of this object; _on_receive ignores
+        # packets while disconnected, so reconnects don't touch pubsub
+        pub.subscribe(self._on_receive, self.RECEIVE_TOPIC)
+        pub.subscribe(self._on_node_info, self.NODE_INFO_TOPIC)
         
     def connect(self, max_retries: int = 3) -> bool:
         """
@@ -88,6 +209,8 @@ class MeshtasticInterface:
                 self.logger.warning("Connection state inconsistent - marked connected but no interface")
                 self.connected = False
             
+            self._import_meshtastic()
+            
             port = self.config.serial.port
             self.logger.info(f"Starting connection to Meshtastic node on {port}")
             
@@ -95,9 +218,10 @@ class MeshtasticInterface:
             if not self._pre_connection_checks(port):
                 return False
             
-            # Progressive timeouts for each retry
+            # Progressive timeouts for each retry; the node needs several
+            # seconds to send its config, so these stay fixed
             timeouts = [5, 10, 15]  # seconds
-            retry_delays = [1, 2, 3]  # seconds between retries
+            backoff = ExponentialBackoff()
             
             for attempt in range(max_retries):
                 timeout = timeouts[min(attempt, len(timeouts) - 1)]
@@ -110,8 +234,8 @@ class MeshtasticInterface:
                 
                 # Wait before next retry (except on last attempt)
                 if attempt < max_retries - 1:
-                    delay = retry_delays[min(attempt, len(retry_delays) - 1)]
-                    self.logger.info(f"Waiting {delay}s before retry...")
+                    delay = backoff.on_failure()
+                    self.logger.info(f"Waiting {delay:.2f}s before retry...")
                     time.sleep(delay)
             
             self.logger.error(f"Failed to connect after {max_retries} attempts")
@@ -137,36 +261,17 @@ class MeshtasticInterface:
         
         self.logger.debug(f"✓ Port {port} exists")
         
-        # Check basic port accessibility
-        try:
-            with serial.Serial(port, self.config.serial.baudrate, timeout=0.1) as ser:
-                self.logger.debug(f"✓ Port {port} is accessible for basic operations")
-        except serial.SerialException as e:
-            self.logger.error(f"Cannot access port {port}: {e}")
-            
-            # Provide helpful error context
-            if "Permission denied" in str(e):
-                self.logger.error("Permission denied - user may need to be added to dialout group")
-                self.logger.info("Try: sudo usermod -a -G dialout $USER && newgrp dialout")
-            elif "Device or resource busy" in str(e):
-                self.logger.error("Port is busy - another process may be using it")
-                self.logger.info("Check if another BBMesh instance or Meshtastic client is running")
-            
-            return False
-        except Exception as e:
-            self.logger.error(f"Unexpected error accessing port {port}: {e}")
-            return False
-        
-        # Test exclusive lock availability (critical for Meshtastic library)
-        if not self._test_exclusive_lock(port):
-            return False
-        
-        return True
+        # A single exclusive open (critical for Meshtastic library) also
+        # proves the port is accessible; diagnostics only run if it fails
+        return self._test_exclusive_lock(port)
     
     def _test_exclusive_lock(self, port: str) -> bool:
         """
         Test if exclusive lock can be obtained on the serial port
         
+        If the lock is held and conflict resolution is enabled, the
+        conflicts are resolved and the lock is tested once more.
+        
         Args:
             port: Serial port path
             
@@ -176,22 +281,13 @@ class MeshtasticInterface:
         self.logger.debug("Testing exclusive lock availability")
         
         try:
-            # Open port with exclusive access (same as Meshtastic library does)
-            ser = serial.Serial()
-            ser.port = port
-            ser.baudrate = self.config.serial.baudrate
-            ser.timeout = 0.1
-            ser.exclusive = True  # This is the key parameter
-            
-            ser.open()
-            self.logger.debug(f"✓ Exclusive lock available on {port}")
-            ser.close()
-            return True
+            error = self._try_exclusive_open(port)
+            if error is None:
+                return True
             
-        except serial.SerialException as e:
-            error_msg = str(e).lower()
+            error_msg = str(error).lower()
             if "resource temporarily unavailable" in error_msg or "could not exclusively lock port" in error_msg:
-                self.logger.error(f"✗ Exclusive lock not available on {port}: {e}")
+                self.logger.error(f"✗ Exclusive lock not available on {port}: {error}")
                 
                 # Identify what is holding the lock
                 lock_holders = self._identify_lock_holders(port)
@@ -200,12 +296,15 @@ class MeshtasticInterface:
                     for holder in lock_holders:
                         self.logger.error(f"  • {holder['command']} (PID: {holder['pid']}) - User: {holder.get('user', 'unknown')}")
                     
-                    # Try to resolve conflicts if possible
+                    # Try to resolve conflicts if possible, then retest once
                     if self._should_resolve_conflicts():
                         self.logger.info("Attempting to resolve port conflicts...")
                         if self._resolve_port_conflicts(port, lock_holders):
                             self.logger.info("Port conflicts resolved, retesting exclusive lock...")
-                            return self._test_exclusive_lock(port)  # Retry once
+                            error = self._try_exclusive_open(port)
+                            if error is None:
+                                return True
+                            self.logger.error(f"✗ Exclusive lock still not available on {port}: {error}")
                 else:
                     self.logger.error("Could not identify process holding the exclusive lock")
                     self.logger.info("Manual steps to try:")
@@ -216,13 +315,45 @@ class MeshtasticInterface:
                 return False
             else:
                 # Other serial errors
-                self.logger.error(f"Serial error during exclusive lock test: {e}")
+                self.logger.error(f"Cannot access port {port}: {error}")
+                
+                # Provide helpful error context
+                for substring, hint, tip in _PORT_ACCESS_HINTS:
+                    if substring in error_msg:
+                        self.logger.error(hint)
+                        self.logger.info(tip)
+                        break
+                
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Unexpected error testing exclusive lock: {e}")
+            self.logger.error(f"Unexpected error accessing port {port}: {e}")
             return False
     
+    def _try_exclusive_open(self, port: str) -> Optional[serial.SerialException]:
+        """
+        Open and close the port with exclusive access (same as Meshtastic library does)
+        
+        Args:
+            port: Serial port path
+            
+        Returns:
+            None if the port could be opened, otherwise the serial error
+        """
+        try:
+            ser = serial.Serial()
+            ser.port = port
+            ser.baudrate = self.config.serial.baudrate
+            ser.timeout = 0.1
+            ser.exclusive = True  # This is the key parameter
+            
+            ser.open()
+            self.logger.debug(f"✓ Exclusive lock available on {port}")
+            ser.close()
+            return None
+        except serial.SerialException as e:
+            return e
+    
     def _identify_lock_holders(self, port: str) -> List[Dict[str, str]]:
         """
         Identify processes that are using the serial port
@@ -233,28 +364,37 @@ class MeshtasticInterface:
         Returns:
             List of dictionaries with process information
         """
+        processes = self._scan_proc_for_port(port)
+        if processes is not None:
+            return processes
+        
         processes = []
         
         try:
-            # Use lsof to find processes using the device
+            # No /proc (non-Linux), use lsof to find processes using the device.
+            # -F emits one prefixed field per line (p<pid>, c<command>,
+            # L<login>, f<fd>), so no column splitting is needed
             result = subprocess.run(
-                ["lsof", port],
+                ["lsof", "-F", "pcL", port],
                 capture_output=True,
-                text=True,
                 timeout=5
             )
             
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        processes.append({
-                            "command": parts[0],
-                            "pid": parts[1],
-                            "user": parts[2] if len(parts) > 2 else "unknown",
-                            "full_line": line
-                        })
+                current = None
+                for line in result.stdout.splitlines():
+                    if not line:
+                        continue
+                    field = line[:1]
+                    value = line[1:].decode('utf-8', errors='replace')
+                    if field == b'p':
+                        current = {"pid": value, "command": f"PID {value}", "user": "unknown"}
+                        processes.append(current)
+                    elif current is not None:
+                        if field == b'c':
+                            current["command"] = value
+                        elif field == b'L':
+                            current["user"] = value
             
         except subprocess.TimeoutExpired:
             self.logger.debug(f"lsof timeout for {port}")
@@ -285,6 +425,74 @@ class MeshtasticInterface:
         
         return processes
     
+    def _scan_proc_for_port(self, port: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Find processes with the serial port open by reading /proc directly
+        
+        Args:
+            port: Serial port path
+            
+        Returns:
+            List of dictionaries with process information, or None if /proc
+            is not available
+        """
+        target = os.path.realpath(port)
+        processes = []
+        
+        try:
+            proc_entries = os.scandir('/proc')
+        except OSError:
+            return None
+        
+        with proc_entries:
+            for entry in proc_entries:
+                if not entry.name.isdigit():
+                    continue
+                pid = entry.name
+                
+                # fd directories of other users' processes are unreadable
+                # without root, and processes may exit while being scanned
+                try:
+                    with os.scandir(f"/proc/{pid}/fd") as fds:
+                        holds_port = any(self._readlink_or_none(fd.path) == target for fd in fds)
+                except OSError:
+                    continue
+                if not holds_port:
+                    continue
+                
+                command = f"PID {pid}"
+                user = "unknown"
+                try:
+                    with open(f"/proc/{pid}/comm") as f:
+                        command = f.read().strip() or command
+                    with open(f"/proc/{pid}/status") as f:
+                        for line in f:
+                            if line.startswith("Uid:"):
+                                uid = int(line.split()[1])
+                                try:
+                                    user = pwd.getpwuid(uid).pw_name
+                                except KeyError:
+                                    user = str(uid)
+                                break
+                except (OSError, ValueError, IndexError):
+                    pass
+                
+                processes.append({
+                    "command": command,
+                    "pid": pid,
+                    "user": user
+                })
+        
+        return processes
+    
+    @staticmethod
+    def _readlink_or_none(path: str) -> Optional[str]:
+        """Resolve a /proc fd symlink, or None if it has gone away"""
+        try:
+            return os.readlink(path)
+        except OSError:
+            return None
+    
     def _should_resolve_conflicts(self) -> bool:
         """
         Determine if automatic conflict resolution should be attempted
@@ -308,80 +516,56 @@ class MeshtasticInterface:
         resolved_any = False
         port_basename = os.path.basename(port)
         
+        # Privileged steps are collected and run through a single sudo call
+        services_to_stop: List[str] = []
+        files_to_remove: List[str] = []
+        
         for holder in lock_holders:
             command = holder.get("command", "").lower()
             pid = holder.get("pid", "")
             
-            try:
-                # Handle ModemManager
-                if "modemmanager" in command and self.config.serial.stop_modemmanager:
-                    self.logger.info(f"Stopping ModemManager service (PID: {pid})")
-                    result = subprocess.run(
-                        ["sudo", "systemctl", "stop", "ModemManager"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    if result.returncode == 0:
-                        self.logger.info("✓ ModemManager stopped")
-                        resolved_any = True
-                    else:
-                        self.logger.warning(f"Failed to stop ModemManager: {result.stderr}")
-                
-                # Handle getty services
-                elif "getty" in command and self.config.serial.stop_getty_services:
-                    service_name = f"serial-getty@{port_basename}.service"
-                    self.logger.info(f"Disabling serial console service: {service_name}")
-                    result = subprocess.run(
-                        ["sudo", "systemctl", "stop", service_name],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    if result.returncode == 0:
-                        self.logger.info(f"✓ {service_name} stopped")
-                        resolved_any = True
-                    else:
-                        self.logger.debug(f"Could not stop {service_name}: {result.stderr}")
-                
-                # Handle other BBMesh instances
-                elif "bbmesh" in command or "python" in command:
-                    if pid and pid.isdigit():
-                        # Check if this is our own process
-                        our_pid = str(os.getpid())
-                        if pid != our_pid:
-                            self.logger.info(f"Found another BBMesh/Python process using {port} (PID: {pid})")
-                            self.logger.warning("Another BBMesh instance may be running - manual intervention required")
-                            # Don't automatically kill other BBMesh instances for safety
-                
-                # Handle other processes with caution
-                else:
-                    if pid and pid.isdigit():
-                        self.logger.info(f"Found process {command} using {port} (PID: {pid})")
-                        self.logger.info("Manual intervention may be required to stop this process")
-                        
-            except subprocess.TimeoutExpired:
-                self.logger.warning(f"Timeout while trying to resolve conflict with {command}")
-            except Exception as e:
-                self.logger.debug(f"Error resolving conflict with {command}: {e}")
+            # Handle ModemManager
+            if "modemmanager" in command and self.config.serial.stop_modemmanager:
+                self.logger.info(f"Stopping ModemManager service (PID: {pid})")
+                if "ModemManager" not in services_to_stop:
+                    services_to_stop.append("ModemManager")
+            
+            # Handle getty services
+            elif "getty" in command and self.config.serial.stop_getty_services:
+                service_name = f"serial-getty@{port_basename}.service"
+                self.logger.info(f"Disabling serial console service: {service_name}")
+                if service_name not in services_to_stop:
+                    services_to_stop.append(service_name)
+            
+            # Handle other BBMesh instances
+            elif "bbmesh" in command or "python" in command:
+                if pid and pid.isdigit():
+                    # Check if this is our own process
+                    our_pid = str(os.getpid())
+                    if pid != our_pid:
+                        self.logger.info(f"Found another BBMesh/Python process using {port} (PID: {pid})")
+                        self.logger.warning("Another BBMesh instance may be running - manual intervention required")
+                        # Don't automatically kill other BBMesh instances for safety
+            
+            # Handle other processes with caution
+            else:
+                if pid and pid.isdigit():
+                    self.logger.info(f"Found process {command} using {port} (PID: {pid})")
+                    self.logger.info("Manual intervention may be required to stop this process")
         
         # Clean up stale lock files
         if self.config.serial.remove_stale_locks:
-            lock_file_paths = [
-                f"/var/lock/LCK..{port_basename}",
-                f"/tmp/LCK..{port_basename}",
-                f"/var/run/lock/LCK..{port_basename}"
-            ]
-            
-            for lock_file in lock_file_paths:
-                if os.path.exists(lock_file):
-                    try:
-                        self.logger.info(f"Removing stale lock file: {lock_file}")
-                        subprocess.run(["sudo", "rm", lock_file], check=True, timeout=5)
-                        self.logger.info(f"✓ Removed {lock_file}")
-                        resolved_any = True
-                    except Exception as e:
-                        self.logger.debug(f"Could not remove lock file {lock_file}: {e}")
+            removed_any, files_to_remove = self._unlink_stale_locks(port_basename)
+            if removed_any:
+                resolved_any = True
+        
+        steps = [(f"systemctl stop {shlex.quote(service)}", f"{service} stopped")
+                 for service in services_to_stop]
+        steps += [(f"rm -f {shlex.quote(lock_file)}", f"Removed {lock_file}")
+                  for lock_file in files_to_remove]
+        
+        if steps and self._run_privileged_steps(steps):
+            resolved_any = True
         
         if resolved_any:
             # Give the system a moment to release the port
@@ -389,6 +573,101 @@ class MeshtasticInterface:
         
         return resolved_any
     
+    def _unlink_stale_locks(self, port_basename: str) -> Tuple[bool, List[str]]:
+        """
+        Remove the port's lock files that this process may delete itself
+        
+        Files are unlinked directly when running as root or when their
+        directory is writable; anything else is left for a privileged step.
+        
+        Args:
+            port_basename: Device name, e.g. ttyUSB0
+            
+        Returns:
+            (whether any file was removed, lock files that still need sudo)
+        """
+        is_root = os.geteuid() == 0
+        removed_any = False
+        needs_privilege: List[str] = []
+        
+        for lock_dir in self.LOCK_DIRS:
+            lock_file = f"{lock_dir}/LCK..{port_basename}"
+            if is_root or os.access(lock_dir, os.W_OK):
+                # Unlinking directly avoids a stat first
+                try:
+                    os.unlink(lock_file)
+                except FileNotFoundError:
+                    continue
+                except PermissionError:
+                    # e.g. another user's file in sticky /tmp
+                    if not is_root:
+                        self.logger.info(f"Removing stale lock file: {lock_file}")
+                        needs_privilege.append(lock_file)
+                    continue
+                except OSError as e:
+                    self.logger.debug(f"Could not remove lock file {lock_file}: {e}")
+                    continue
+                self.logger.info(f"✓ Removed stale lock file: {lock_file}")
+                removed_any = True
+            elif os.path.exists(lock_file):
+                self.logger.info(f"Removing stale lock file: {lock_file}")
+                needs_privilege.append(lock_file)
+        
+        return removed_any, needs_privilege
+    
+    def _run_privileged_steps(self, steps: List[Tuple[str, str]]) -> bool:
+        """
+        Run shell commands as root through one sudo invocation
+        
+        Each step's outcome is echoed by the script so it can be logged
+        individually.
+        
+        Args:
+            steps: (shell command, success message) pairs
+            
+        Returns:
+            True if at least one step succeeded
+        """
+        script = "; ".join(
+            f"if {cmd} >/dev/null; then echo OK {i}; else echo FAIL {i}; fi"
+            for i, (cmd, _) in enumerate(steps)
+        )
+        
+        argv = ["sh", "-c", script]
+        if os.geteuid() != 0:
+            argv.insert(0, "sudo")
+        
+        try:
+            result = subprocess.run(
+                argv,
+                capture_output=True,
+                text=True,
+                timeout=15
+            )
+        except subprocess.TimeoutExpired:
+            self.logger.warning("Timeout while trying to resolve port conflicts")
+            return False
+        except Exception as e:
+            self.logger.debug(f"Error resolving port conflicts: {e}")
+            return False
+        
+        succeeded = False
+        for line in result.stdout.splitlines():
+            status, _, index = line.partition(" ")
+            if not index.isdigit() or int(index) >= len(steps):
+                continue
+            cmd, success_message = steps[int(index)]
+            if status == "OK":
+                self.logger.info(f"✓ {success_message}")
+                succeeded = True
+            else:
+                self.logger.warning(f"Failed: {cmd}")
+        
+        if result.stderr.strip():
+            self.logger.debug(f"Conflict resolution stderr: {result.stderr.strip()}")
+        
+        return succeeded
+    
     def _attempt_connection(self, port: str, timeout: float, attempt_num: int) -> bool:
         """
         Attempt a single connection to the Meshtastic device
@@ -409,7 +688,7 @@ class MeshtasticInterface:
             self.logger.debug(f"Attempt {attempt_num}: Creating serial interface")
             step_start = time.time()
             
-            interface = meshtastic.serial_interface.SerialInterface(
+            interface = self._serial_interface_cls(
                 devPath=port,
                 debugOut=None  # Disable debug output to reduce noise
             )
@@ -421,19 +700,21 @@ class MeshtasticInterface:
             self.logger.debug(f"Attempt {attempt_num}: Waiting for node info (timeout: {timeout}s)")
             info_start = time.time()
             
-            poll_interval = 0.1
-            last_log_time = info_start
+            # The library sets isConnected (and publishes
+            # meshtastic.connection.established) once the node's config has
+            # arrived, so block on that instead of polling myInfo
             log_interval = 2.0  # Log progress every 2 seconds
-            
-            while not interface.myInfo and (time.time() - info_start) < timeout:
-                time.sleep(poll_interval)
+            deadline = info_start + timeout
+            
+            while not interface.myInfo:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                if interface.isConnected.wait(min(log_interval, remaining)):
+                    break
                 
-                # Log progress periodically
-                current_time = time.time()
-                if current_time - last_log_time >= log_interval:
-                    elapsed = current_time - info_start
-                    self.logger.debug(f"Attempt {attempt_num}: Still waiting for node info ({elapsed:.1f}s elapsed)")
-                    last_log_time = current_time
+                elapsed = time.time() - info_start
+                self.logger.debug(f"Attempt {attempt_num}: Still waiting for node info ({elapsed:.1f}s elapsed)")
             
             info_time = time.time() - info_start
             
@@ -476,13 +757,12 @@ class MeshtasticInterface:
                         attr_value = getattr(interface.myInfo, attr)
                         self.logger.info(f"myInfo.{attr}: {attr_value} (type: {type(attr_value)})")
                 
-                try:
-                    # Try dictionary conversion first (works with older versions)
+                if hasattr(interface.myInfo, 'keys'):
+                    # Dict-like myInfo (older versions) can be copied directly
                     self.node_info = dict(interface.myInfo)
                     self.logger.info(f"✅ Successfully converted myInfo to dict: {self.node_info}")
-                except (TypeError, AttributeError) as e:
-                    self.logger.info(f"❌ Dict conversion failed: {e}")
-                    # Fall back to attribute access for newer versions
+                else:
+                    # Protobuf messages aren't mappings, so read just the fields we use
                     self.node_info = {
                         'num': getattr(interface.myInfo, 'num', None),
                         'user': getattr(interface.myInfo, 'user', {})
@@ -529,6 +809,8 @@ class MeshtasticInterface:
                 else:
                     self.logger.info(f"✅ SUCCESS: Found local node ID using fallback method: {self.local_node_id}")
             
+            self._update_local_node_num()
+            
             # Log node details
             user_info = self.node_info.get('user', {})
             node_name = user_info.get('longName', 'Unknown')
@@ -536,9 +818,6 @@ class MeshtasticInterface:
             
             self.logger.info(f"Connected to node {self.local_node_id} ({node_name}/{short_name})")
             
-            # Subscribe to message reception
-            pub.subscribe(self._on_receive, "meshtastic.receive")
-            
             # Store interface and mark as connected
             self.interface = interface
             self.connected = True
@@ -558,12 +837,11 @@ class MeshtasticInterface:
             self.logger.error(f"Attempt {attempt_num}: Serial communication error: {e}")
             
             # Provide context for common serial errors
-            if "Permission denied" in str(e):
-                self.logger.error("Serial permission error - check user permissions")
-            elif "No such file or directory" in str(e):
-                self.logger.error("Serial port not found - device may be disconnected")
-            elif "Device or resource busy" in str(e):
-                self.logger.error("Serial port busy - close other applications using the port")
+            error_msg = str(e)
+            for substring, hint in _SERIAL_ERROR_HINTS:
+                if substring in error_msg:
+                    self.logger.error(hint)
+                    break
                 
         except ImportError as e:
             self.logger.error(f"Attempt {attempt_num}: Missing dependency: {e}")
@@ -591,13 +869,16 @@ class MeshtasticInterface:
             if not self.interface:
                 return
             
+            nodes = self.interface.nodes
+            channels = self._get_channels()
+            
             # Log node count
-            if hasattr(self.interface, 'nodes') and self.interface.nodes:
-                node_count = len(self.interface.nodes)
+            if nodes:
+                node_count = len(nodes)
                 self.logger.info(f"Mesh network has {node_count} known nodes")
                 
                 # Log some node details in debug mode
-                for node_id, node_info in list(self.interface.nodes.items())[:5]:  # First 5 nodes
+                for node_id, node_info in list(nodes.items())[:5]:  # First 5 nodes
                     user = node_info.get('user', {})
                     name = user.get('shortName', user.get('longName', 'Unknown'))
                     self.logger.debug(f"  Node {node_id}: {name}")
@@ -606,8 +887,8 @@ class MeshtasticInterface:
                     self.logger.debug(f"  ... and {node_count - 5} more nodes")
             
             # Log channel information
-            if hasattr(self.interface, 'channels') and self.interface.channels:
-                channel_count = len(self.interface.channels)
+            if channels:
+                channel_count = len(channels)
                 self.logger.info(f"Device has {channel_count} configured channels")
                 
         except Exception as e:
@@ -702,6 +983,33 @@ class MeshtasticInterface:
             self.logger.error(f"Error in fallback node ID detection: {e}")
             return None
     
+    def set_monitored_channels(self, channels: List[int]) -> None:
+        """
+        Change which channels broadcasts are accepted on
+        
+        Args:
+            channels: Channel numbers to monitor
+        """
+        self.config.monitored_channels = list(channels)
+        self._monitored = frozenset(channels)
+    
+    def _update_local_node_num(self) -> None:
+        """Parse local_node_id once so received packets can be compared as integers"""
+        self._local_node_num = None
+        if self.local_node_id is None:
+            return
+        
+        try:
+            if self.local_node_id.startswith('!'):
+                # !-prefixed hex format (e.g., "!a0cbef24")
+                self._local_node_num = int(self.local_node_id[1:], 16)
+            else:
+                # Fallback: try to parse as integer directly
+                self._local_node_num = int(self.local_node_id)
+        except ValueError as e:
+            self.logger.warning(f"Could not parse local node ID {self.local_node_id}: {e} - "
+                                f"direct message detection disabled")
+    
     def _validate_direct_message_config(self) -> None:
         """Validate configuration for direct message functionality"""
         try:
@@ -714,7 +1022,7 @@ class MeshtasticInterface:
                     self.logger.info("Will ONLY process direct messages sent to this node")
 
                 # Log BROADCAST_ADDR for debugging
-                self.logger.debug(f"BROADCAST_ADDR constant value: {BROADCAST_ADDR} (type: {type(BROADCAST_ADDR)})")
+                self.logger.debug(f"BROADCAST_ADDR constant value: {self._broadcast_addr} (type: {type(self._broadcast_addr)})")
             else:
                 self.logger.info(f"Processing both direct messages and broadcasts on channels: {self.config.monitored_channels}")
 
@@ -757,7 +1065,7 @@ class MeshtasticInterface:
         if self.last_received_message_time is None:
             return False  # No messages yet since startup
 
-        time_since_last = (datetime.now() - self.last_received_message_time).total_seconds()
+        time_since_last = time.time() - self.last_received_message_time
 
         # Warn if no messages for extended period
         # (But don't trigger on legitimate idle networks)
@@ -789,7 +1097,7 @@ class MeshtasticInterface:
         if success:
             self.logger.info("Reconnection successful")
             # Reset last message time
-            self.last_received_message_time = datetime.now()
+            self.last_received_message_time = time.time()
         else:
             self.logger.error("Reconnection failed")
 
@@ -809,25 +1117,12 @@ class MeshtasticInterface:
                 self.logger.debug("Stale lock cleanup disabled in configuration")
                 return
 
-            # Potential lock file locations (varies by system)
-            lock_file_paths = [
-                f"/var/lock/LCK..{port_basename}",
-                f"/tmp/LCK..{port_basename}",
-                f"/var/run/lock/LCK..{port_basename}"
-            ]
-
-            cleaned_any = False
-            for lock_file in lock_file_paths:
-                if os.path.exists(lock_file):
-                    try:
-                        self.logger.info(f"Removing stale lock file during disconnect: {lock_file}")
-                        subprocess.run(["sudo", "rm", lock_file], check=True, timeout=5)
-                        self.logger.info(f"✓ Removed lock file: {lock_file}")
-                        cleaned_any = True
-                    except subprocess.CalledProcessError as e:
-                        self.logger.warning(f"Could not remove lock file {lock_file}: {e}")
-                    except Exception as e:
-                        self.logger.debug(f"Error removing lock file {lock_file}: {e}")
+            cleaned_any, remaining = self._unlink_stale_locks(port_basename)
+            if remaining:
+                steps = [(f"rm -f {shlex.quote(lock_file)}", f"Removed lock file: {lock_file}")
+                         for lock_file in remaining]
+                if self._run_privileged_steps(steps):
+                    cleaned_any = True
 
             if cleaned_any:
                 # Give the system a moment to fully release the port
@@ -843,7 +1138,6 @@ class MeshtasticInterface:
             if self.interface:
                 try:
                     self.logger.info("Disconnecting from Meshtastic node...")
-                    pub.unsubscribe(self._on_receive, "meshtastic.receive")
                     self.interface.close()
                     # Give the OS time to release the exclusive lock on the serial port
                     time.sleep(0.1)
@@ -868,7 +1162,8 @@ class MeshtasticInterface:
         Args:
             callback: Function that takes a MeshMessage parameter
         """
-        self.message_callbacks.append(callback)
+        with self._cb_lock:
+            self.message_callbacks = self.message_callbacks + (callback,)
     
     def remove_message_callback(self, callback: Callable[[MeshMessage], None]) -> None:
         """
@@ -877,8 +1172,11 @@ class MeshtasticInterface:
         Args:
             callback: Function to remove
         """
-        if callback in self.message_callbacks:
-            self.message_callbacks.remove(callback)
+        with self._cb_lock:
+            callbacks = list(self.message_callbacks)
+            if callback in callbacks:
+                callbacks.remove(callback)
+                self.message_callbacks = tuple(callbacks)
     
     def _split_message(self, text: str) -> List[str]:
         """
@@ -1006,58 +1304,57 @@ class MeshtasticInterface:
             self.logger.error("Cannot send message - not connected to Meshtastic node")
             return False
         
-        try:
-            # Enforce message send delay to prevent rapid-fire sending
-            current_time = time.time()
-            time_since_last = current_time - self._last_message_time
-            
-            if time_since_last < self.message_send_delay:
-                delay_needed = self.message_send_delay - time_since_last
-                self.logger.info(f"⏱️ Applying message send delay: {delay_needed:.2f}s")
-                time.sleep(delay_needed)
-            
-            # Final length check (should not be needed, but safety first)
-            if len(text) > self.max_message_length:
-                self.logger.warning(f"📤 Message part still too long ({len(text)} chars), truncating")
-                text = text[:self.max_message_length-3] + "..."
-            
-            # Send message using existing Meshtastic logic
-            if destination:
-                # Ensure destination is in proper format for Meshtastic
-                if destination.isdigit():
-                    # Convert numeric destination to !-prefixed format
-                    numeric_dest = int(destination)
-                    hex_dest = self.numeric_to_hex_id(numeric_dest)
-                    meshtastic_destination = hex_dest
-                elif destination.startswith('!'):
-                    # Already in proper format
-                    meshtastic_destination = destination
+        # Hold the send lock so the delay is enforced across threads
+        with self._send_lock:
+            try:
+                # Enforce message send delay to prevent rapid-fire sending
+                current_time = time.time()
+                time_since_last = current_time - self._last_message_time
+                
+                if time_since_last < self.message_send_delay:
+                    delay_needed = self.message_send_delay - time_since_last
+                    self.logger.info(f"⏱️ Applying message send delay: {delay_needed:.2f}s")
+                    time.sleep(delay_needed)
+                
+                # Final length check (should not be needed, but safety first)
+                if len(text) > self.max_message_length:
+                    self.logger.warning(f"📤 Message part still too long ({len(text)} chars), truncating")
+                    text = f"{text[:self._truncate_at]}{self.TRUNCATION_SUFFIX}"
+                
+                # Send message using existing Meshtastic logic
+                if destination:
+                    # Ensure destination is in proper format for Meshtastic
+                    if destination.isdigit():
+                        # Convert numeric destination to !-prefixed format
+                        numeric_dest = int(destination)
+                        hex_dest = self.numeric_to_hex_id(numeric_dest)
+                        meshtastic_destination = hex_dest
+                    elif destination.startswith('!'):
+                        # Already in proper format
+                        meshtastic_destination = destination
+                    else:
+                        # Try to ensure proper format
+                        meshtastic_destination = self.ensure_hex_id_format(destination)
+                    destination_label = meshtastic_destination
                 else:
-                    # Try to ensure proper format
-                    meshtastic_destination = self.ensure_hex_id_format(destination)
+                    # Broadcast message (sendText's default destination)
+                    meshtastic_destination = self._broadcast_addr
+                    destination_label = "BROADCAST"
                 
-                # Direct message to specific node
                 self.interface.sendText(
                     text=text,
                     destinationId=meshtastic_destination,
                     channelIndex=channel
                 )
-                self.logger.log_message("TX", meshtastic_destination, channel, text, self.local_node_id)
-            else:
-                # Broadcast message
-                self.interface.sendText(
-                    text=text,
-                    channelIndex=channel
-                )
-                self.logger.log_message("TX", "BROADCAST", channel, text, self.local_node_id)
-            
-            # Update last message time after successful send
-            self._last_message_time = time.time()
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"💥 Failed to send message part: {e}")
-            return False
+                self.logger.log_message("TX", destination_label, channel, text, self.local_node_id)
+                
+                # Update last message time after successful send
+                self._last_message_time = time.time()
+                return True
+                
+            except Exception as e:
+                self.logger.error(f"💥 Failed to send message part: {e}")
+                return False
     
     def send_message(self, text: str, channel: int = 0, 
                     destination: Optional[str] = None) -> bool:
@@ -1113,11 +1410,16 @@ class MeshtasticInterface:
         
         try:
             nodes = self.interface.nodes
-            return nodes.get(node_id)
+            return nodes.get(node_id) if nodes is not None else None
         except Exception as e:
             self.logger.error(f"Failed to get node info for {node_id}: {e}")
             return None
     
+    def _get_channels(self) -> Optional[List[Any]]:
+        """Channel table of the connected node, which lives on interface.localNode"""
+        local_node = getattr(self.interface, 'localNode', None)
+        return getattr(local_node, 'channels', None)
+    
     def get_channel_info(self, channel: int) -> Optional[Dict[str, Any]]:
         """
         Get information about a specific channel
@@ -1132,8 +1434,8 @@ class MeshtasticInterface:
             return None
         
         try:
-            channels = getattr(self.interface, 'channels', [])
-            if 0 <= channel < len(channels):
+            channels = self._get_channels()
+            if channels is not None and 0 <= channel < len(channels):
                 return channels[channel]
             return None
         except Exception as e:
@@ -1148,49 +1450,39 @@ class MeshtasticInterface:
             packet: Received packet data
             interface: Meshtastic interface (unused)
         """
+        if not self.connected:
+            return
+        
+        logger = self.logger
+        broadcast_addr = self._broadcast_addr
         try:
-            # Extract packet information
-            decoded = packet.get('decoded', {})
-
-            # Only process text messages
-            if decoded.get('portnum') != 'TEXT_MESSAGE_APP':
+            # Only process text messages; encrypted packets have no 'decoded'
+            decoded = packet.get('decoded')
+            if not decoded or decoded.get('portnum') != _TEXT_PORT:
                 return
 
             # Update last message timestamp - track that we're receiving TEXT messages
             # (Must be after TEXT_MESSAGE_APP check to avoid false positives from telemetry/position packets)
-            self.last_received_message_time = datetime.now()
+            self.last_received_message_time = time.time()
+            
+            # Checked once so debug-only f-strings are skipped in production
+            debug = logger.isEnabledFor(logging.DEBUG)
             
             # Extract message data
             from_id_numeric = str(packet.get('from', 'unknown'))
             to_id = packet.get('to')
             channel = packet.get('channel', 0)
-            text = decoded.get('payload', b'').decode('utf-8', errors='ignore')
-            hop_limit = packet.get('hopLimit', 0)
-            
-            # Convert sender ID to proper !-prefixed format for consistency
-            if from_id_numeric != 'unknown':
-                try:
-                    from_id = self.ensure_hex_id_format(from_id_numeric)
-                    self.logger.debug(f"🔄 ID CONVERSION: {from_id_numeric} → {from_id}")
-                except Exception as e:
-                    self.logger.debug(f"⚠️ Could not convert from_id {from_id_numeric}: {e}")
-                    from_id = from_id_numeric
-            else:
-                from_id = from_id_numeric
-            
-            # Get signal quality information
-            snr = packet.get('rxSnr', 0.0)
-            rssi = packet.get('rxRssi', -999)
             
             # Learn local node ID from direct messages if we don't have it yet
-            self.logger.debug(f"🔍 AUTO-LEARNING CHECK: local_node_id={self.local_node_id}, to_id={to_id}, BROADCAST_ADDR={BROADCAST_ADDR}")
-            if self.local_node_id is None and to_id != BROADCAST_ADDR and str(to_id) != "^all":
+            if debug:
+                logger.debug(f"🔍 AUTO-LEARNING CHECK: local_node_id={self.local_node_id}, to_id={to_id}, BROADCAST_ADDR={broadcast_addr}")
+            if self.local_node_id is None and to_id != broadcast_addr and str(to_id) != "^all":
                 # If we receive a message with a specific to_id, that might be our local node ID
                 try:
                     to_id_int = int(to_id) if to_id is not None else None
-                    self.logger.info(f"🔍 Checking to_id_int: {to_id_int}")
-                    if to_id_int and to_id_int != 4294967295 and to_id_int != -1:
-                        self.logger.info(f"🎯 LEARNING NODE ID: Message addressed to {to_id_int} - this IS our local node ID!")
+                    logger.info(f"🔍 Checking to_id_int: {to_id_int}")
+                    if to_id_int and to_id_int not in _BROADCAST_NUMS:
+                        logger.info(f"🎯 LEARNING NODE ID: Message addressed to {to_id_int} - this IS our local node ID!")
                         
                         # Set the local node ID (thread-safe update) - convert to proper !-prefixed format
                         with self._connection_lock:  # Ensure thread-safe update
@@ -1198,93 +1490,90 @@ class MeshtasticInterface:
                             # Convert numeric node ID to proper Meshtastic format (!hexvalue)
                             hex_node_id = f"!{to_id_int:08x}"
                             self.local_node_id = hex_node_id
+                            self._local_node_num = to_id_int
                             self.node_info['num'] = to_id_int
                             # Also store the user info with proper ID
                             if 'user' not in self.node_info:
                                 self.node_info['user'] = {}
                             self.node_info['user']['id'] = hex_node_id
                             
-                            self.logger.info(f"✅ AUTO-LEARNED local node ID: {old_local_node_id} -> {self.local_node_id}")
-                            self.logger.info(f"✅ Updated node_info: {self.node_info}")
+                            logger.info(f"✅ AUTO-LEARNED local node ID: {old_local_node_id} -> {self.local_node_id}")
+                            logger.info(f"✅ Updated node_info: {self.node_info}")
                             
                             # This is critical - we now know our node ID and can process messages correctly
-                            self.logger.info(f"🎉 DIRECT MESSAGE DETECTION NOW ENABLED!")
+                            logger.info(f"🎉 DIRECT MESSAGE DETECTION NOW ENABLED!")
                     else:
-                        self.logger.debug(f"to_id_int {to_id_int} is broadcast or invalid, not learning from it")
+                        logger.debug(f"to_id_int {to_id_int} is broadcast or invalid, not learning from it")
                 except (ValueError, TypeError) as e:
-                    self.logger.debug(f"Could not learn node ID from to_id {to_id}: {e}")
-            else:
+                    logger.debug(f"Could not learn node ID from to_id {to_id}: {e}")
+            elif debug:
                 if self.local_node_id is not None:
-                    self.logger.debug(f"Already have local_node_id: {self.local_node_id}")
+                    logger.debug(f"Already have local_node_id: {self.local_node_id}")
                 else:
-                    self.logger.debug(f"to_id {to_id} is broadcast, not learning from it")
+                    logger.debug(f"to_id {to_id} is broadcast, not learning from it")
             
-            # Determine if this is a direct message
-            # Handle case where local_node_id might be None
-            is_direct = False
+            # Determine if this is a direct message. The packet's "to" is the
+            # numeric node number, and broadcasts (0xFFFFFFFF) never equal the
+            # local node number, so no parsing or broadcast checks are needed
+            local_id_int = self._local_node_num
+            is_direct = local_id_int is not None and to_id == local_id_int
+            
+            if debug:
+                if local_id_int is None:
+                    logger.debug("DM Detection - local node number unknown, cannot detect direct messages")
+                else:
+                    logger.debug(f"DM Detection - to_id: {to_id} (type: {type(to_id)}), "
+                               f"from_id: {from_id_numeric}, local_node_id: {self.local_node_id} ({local_id_int}), "
+                               f"BROADCAST_ADDR: {broadcast_addr} -> is_direct={is_direct}")
+            
+            # Filter messages based on configuration before doing any more work
+            # Direct messages are always processed; broadcasts only on
+            # monitored channels and when not in direct-message-only mode
+            should_process = is_direct or (
+                not self.config.direct_message_only and channel in self._monitored
+            )
+            if debug:
+                logger.debug(f"Message filtering - channel: {channel}, is_direct: {is_direct}, "
+                           f"direct_message_only: {self.config.direct_message_only}, "
+                           f"monitored_channels: {self.config.monitored_channels}, "
+                           f"should_process: {should_process}")
             
-            # Debug logging for direct message detection
-            self.logger.debug(f"DM Detection - to_id: {to_id} (type: {type(to_id)}), "
-                            f"from_id: {from_id}, local_node_id: {self.local_node_id} (type: {type(self.local_node_id)}), "
-                            f"BROADCAST_ADDR: {BROADCAST_ADDR} (type: {type(BROADCAST_ADDR)})")
+            if not should_process:
+                if debug:
+                    logger.debug(f"Message REJECTED - From: {from_id_numeric}, "
+                               f"Channel: {channel}, Direct: {is_direct}")
+                return
             
-            if self.local_node_id is not None:
+            # Convert sender ID to proper !-prefixed format for consistency
+            if from_id_numeric != 'unknown':
                 try:
-                    # Extract numeric part from !-prefixed local node ID for comparison
-                    if self.local_node_id.startswith('!'):
-                        local_id_hex = self.local_node_id[1:]  # Remove the !
-                        local_id_int = int(local_id_hex, 16)   # Convert hex to int
-                    else:
-                        # Fallback: try to parse as integer directly
-                        local_id_int = int(self.local_node_id)
-                    
-                    to_id_int = int(to_id) if to_id is not None else None
-                    
-                    # Check for broadcast addresses - handle multiple formats
-                    is_broadcast = (
-                        to_id == BROADCAST_ADDR or  # String format "^all"
-                        to_id_int == 4294967295 or  # Standard broadcast address
-                        to_id_int == -1 or          # Signed broadcast address
-                        to_id == "^all"             # Explicit string check
-                    )
-                    
-                    if is_broadcast:
-                        is_direct = False
-                        self.logger.debug(f"DM Detection - Message is broadcast (to_id={to_id}, to_id_int={to_id_int})")
-                    else:
-                        is_direct = to_id_int == local_id_int
-                        self.logger.debug(f"DM Detection - Comparing: to_id_int={to_id_int} == local_id_int={local_id_int} (from {self.local_node_id}) -> is_direct={is_direct}")
-                    
-                except (ValueError, TypeError) as e:
-                    self.logger.debug(f"Error comparing node IDs for direct message detection: {e}")
-                    self.logger.debug(f"Failed conversion - to_id: {to_id}, local_node_id: {self.local_node_id}")
-                    is_direct = False
+                    from_id = self.ensure_hex_id_format(from_id_numeric)
+                    if debug:
+                        logger.debug(f"🔄 ID CONVERSION: {from_id_numeric} → {from_id}")
+                except Exception as e:
+                    logger.debug(f"⚠️ Could not convert from_id {from_id_numeric}: {e}")
+                    from_id = from_id_numeric
             else:
-                self.logger.debug("DM Detection - local_node_id is None, cannot detect direct messages")
-                is_direct = False
+                from_id = from_id_numeric
             
-            # Get sender name
+            # Only accepted messages are decoded and resolved to a sender name
+            # The library already decodes valid UTF-8 into 'text'; only
+            # malformed payloads need decoding here
+            text = decoded.get('text')
+            if text is None:
+                text = decoded.get('payload', b'').decode('utf-8', errors='ignore')
+            hop_limit = packet.get('hopLimit', 0)
+            snr = packet.get('rxSnr', 0.0)
+            rssi = packet.get('rxRssi', -999)
             sender_name = self._get_node_name(from_id)
             
-            # Filter messages based on configuration
-            should_process = self._should_process_message(channel, is_direct)
-            self.logger.debug(f"Message filtering - channel: {channel}, is_direct: {is_direct}, "
-                            f"direct_message_only: {self.config.direct_message_only}, "
-                            f"monitored_channels: {self.config.monitored_channels}, "
-                            f"should_process: {should_process}")
-            
-            if not should_process:
-                self.logger.debug(f"Message REJECTED - From: {sender_name}({from_id}), "
-                                f"Channel: {channel}, Direct: {is_direct}, Text: '{text}'")
-                return
-            
             # Create message object
             message = MeshMessage(
                 sender_id=from_id,
                 sender_name=sender_name,
                 channel=channel,
                 text=text,
-                timestamp=datetime.now(),
+                timestamp=time.time(),
                 is_direct=is_direct,
                 hop_limit=hop_limit,
                 snr=snr,
@@ -1294,36 +1583,51 @@ class MeshtasticInterface:
             
             # Log the message
             msg_type = "DIRECT" if is_direct else "BROADCAST"
-            self.logger.log_message("RX", f"{sender_name}({from_id})", channel, 
-                                  f"[{msg_type}] {text}", self.local_node_id)
+            logger.log_message("RX", f"{sender_name}({from_id})", channel, 
+                             f"[{msg_type}] {text}", self.local_node_id)
             
             # Call message callbacks
-            self.logger.info(f"📞 CALLING MESSAGE CALLBACKS - {len(self.message_callbacks)} callbacks registered")
-            for i, callback in enumerate(self.message_callbacks):
+            callbacks = self.message_callbacks
+            logger.info(f"📞 CALLING MESSAGE CALLBACKS - {len(callbacks)} callbacks registered")
+            for i, callback in enumerate(callbacks):
                 try:
                     callback_name = callback.__name__ if hasattr(callback, '__name__') else str(callback)
-                    self.logger.info(f"📞 Callback {i+1}/{len(self.message_callbacks)}: {callback_name}")
-                    self.logger.info(f"📞 About to call callback with message: from={message.sender_id}, to={message.to_node}, text='{message.text}', is_direct={message.is_direct}")
+                    logger.info(f"📞 Callback {i+1}/{len(callbacks)}: {callback_name}")
+                    logger.info(f"📞 About to call callback with message: from={message.sender_id}, to={message.to_node}, text='{message.text}', is_direct={message.is_direct}")
                     
                     # Call the callback
                     callback(message)
                     
-                    self.logger.info(f"✅ Callback {i+1} completed successfully")
+                    logger.info(f"✅ Callback {i+1} completed successfully")
                 except Exception as e:
-                    self.logger.error(f"💥 CRITICAL: Error in message callback {i+1} ({callback}): {e}")
+                    logger.error(f"💥 CRITICAL: Error in message callback {i+1} ({callback}): {e}")
                     import traceback
-                    self.logger.error(f"💥 Callback traceback: {traceback.format_exc()}")
+                    logger.error(f"💥 Callback traceback: {traceback.format_exc()}")
                     # Do not let callback exceptions affect interface state
                     continue
             
-            self.logger.info(f"✅ All message callbacks completed")
+            logger.info(f"✅ All message callbacks completed")
                     
         except Exception as e:
-            self.logger.error(f"CRITICAL: Error processing received message: {e}")
+            logger.error(f"CRITICAL: Error processing received message: {e}")
             import traceback
-            self.logger.error(f"Message processing traceback: {traceback.format_exc()}")
+            logger.error(f"Message processing traceback: {traceback.format_exc()}")
             # Do not let message processing exceptions affect interface state
-            self.logger.error("Message processing failed but interface remains connected")
+            logger.error("Message processing failed but interface remains connected")
+    
+    def _on_node_info(self, packet: Dict[str, Any], interface=None) -> None:
+        """
+        Drop a node's cached display name when it announces new user info
+        
+        Args:
+            packet: Received NODEINFO_APP packet
+            interface: Meshtastic interface (unused)
+        """
+        try:
+            node_id = packet['decoded']['user']['id']
+        except (KeyError, TypeError):
+            return
+        self._name_cache.pop(node_id, None)
     
     def _get_node_name(self, node_id: str) -> str:
         """
@@ -1335,44 +1639,29 @@ class MeshtasticInterface:
         Returns:
             Node display name or ID if name not available
         """
+        now = time.monotonic()
+        cached = self._name_cache.get(node_id)
+        if cached is not None and now - cached[0] < self.NAME_CACHE_TTL:
+            return cached[1]
+        
+        name = node_id
         try:
-            if self.interface and hasattr(self.interface, 'nodes'):
-                node_info = self.interface.nodes.get(node_id, {})
+            # Read through the interface each time: the library replaces its
+            # nodes dict whenever it restarts config, e.g. after a reboot
+            interface = self.interface
+            nodes = interface.nodes if interface is not None else None
+            if nodes is not None:
+                node_info = nodes.get(node_id, {})
                 user_info = node_info.get('user', {})
-                return user_info.get('shortName', user_info.get('longName', node_id))
+                name = user_info.get('shortName', user_info.get('longName', node_id))
         except Exception:
             pass
-        return node_id
-    
-    def _should_process_message(self, channel: int, is_direct: bool) -> bool:
-        """
-        Determine if a message should be processed based on configuration
-        
-        Args:
-            channel: Message channel
-            is_direct: Whether message is direct to this node
-            
-        Returns:
-            True if message should be processed
-        """
-        # Always process direct messages
-        if is_direct:
-            self.logger.debug(f"Processing direct message (is_direct=True)")
-            return True
-            
-        # If direct message only mode, ignore broadcasts
-        if self.config.direct_message_only:
-            self.logger.debug(f"Rejecting broadcast message - direct_message_only mode enabled")
-            return False
-            
-        # Check if channel is monitored
-        is_monitored = channel in self.config.monitored_channels
-        if is_monitored:
-            self.logger.debug(f"Processing broadcast message on monitored channel {channel}")
-        else:
-            self.logger.debug(f"Rejecting message on unmonitored channel {channel}")
         
-        return is_monitored
+        self._name_cache[node_id] = (now, name)
+        self._name_cache.move_to_end(node_id)
+        if len(self._name_cache) > self.NAME_CACHE_SIZE:
+            self._name_cache.popitem(last=False)
+        return name
     
     @staticmethod
     def numeric_to_hex_id(node_num: int) -> str:
@@ -1441,14 +1730,11 @@ class MeshtasticInterface:
             return {"connected": False}
         
         try:
-            nodes = getattr(self.interface, 'nodes', {})
-            channels = getattr(self.interface, 'channels', [])
-            
             return {
                 "connected": True,
                 "local_node_id": self.local_node_id,
-                "node_count": len(nodes),
-                "channel_count": len(channels),
+                "node_count": len(self.interface.nodes or ()),
+                "channel_count": len(self._get_channels() or ()),
                 "monitored_channels": self.config.monitored_channels,
                 "response_channels": self.config.response_channels,
             }
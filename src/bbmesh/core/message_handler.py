@@ -7,7 +7,7 @@ import re
 import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from collections import defaultdict
 
@@ -68,6 +68,7 @@ class MessageHandler:
         self.config = config
         self.mesh_interface = mesh_interface
         self.motd_content = motd_content
+        self._response_channels = frozenset(config.meshtastic.response_channels)
         self.logger = BBMeshLogger(__name__)
         
         # Initialize menu system
@@ -116,7 +117,7 @@ class MessageHandler:
                 )
                 self.admin_manager = AdminManager(
                     db_path=config.database.path,
-                    config=config.node_tracking.__dict__,
+                    config=asdict(config.node_tracking),
                     mesh_interface=mesh_interface
                 )
                 self.logger.info("Node tracking and admin notifications enabled")
@@ -218,6 +219,8 @@ class MessageHandler:
         """Cleanup resources"""
         self.logger.info("Message handler cleanup")
         self.active_sessions.clear()
+        if self.admin_manager:
+            self.admin_manager.close()
     
     def handle_message(self, message: MeshMessage) -> None:
         """
@@ -591,7 +594,7 @@ class MessageHandler:
                 channel = message.channel
             
             # Check if channel is allowed for responses
-            if channel not in self.config.meshtastic.response_channels:
+            if channel not in self._response_channels:
                 self.logger.warning(f"Channel {channel} not in response channels")
                 return
             
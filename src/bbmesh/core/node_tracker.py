@@ -7,9 +7,10 @@ detecting when nodes are "new" (not seen in the configured threshold period).
 
 import sqlite3
 import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Iterator
 from contextlib import contextmanager
 
 from ..utils.logger import BBMeshLogger
@@ -79,10 +80,23 @@ class NodeTracker:
                         last_seen_at TIMESTAMP NOT NULL,
                         message_count INTEGER DEFAULT 1,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        last_seen_epoch INTEGER
                     )
                 """)
                 
+                # Migrate databases created before last_seen_epoch existed,
+                # backfilling it from the local-time ISO timestamp
+                cursor.execute("PRAGMA table_info(mesh_nodes)")
+                columns = {row['name'] for row in cursor.fetchall()}
+                if 'last_seen_epoch' not in columns:
+                    cursor.execute("ALTER TABLE mesh_nodes ADD COLUMN last_seen_epoch INTEGER")
+                    cursor.execute("""
+                        UPDATE mesh_nodes
+                        SET last_seen_epoch = CAST(strftime('%s', last_seen_at, 'utc') AS INTEGER)
+                    """)
+                    self.logger.info("Added last_seen_epoch column to mesh_nodes")
+                
                 # Create indexes for efficient queries
                 cursor.execute("""
                     CREATE INDEX IF NOT EXISTS idx_last_seen 
@@ -124,10 +138,11 @@ class NodeTracker:
                 with self._get_connection() as conn:
                     cursor = conn.cursor()
                     now = datetime.now()
+                    now_epoch = int(time.time())
                     
                     # Check if node exists
                     cursor.execute(
-                        "SELECT last_seen_at FROM mesh_nodes WHERE node_id = ?",
+                        "SELECT last_seen_at, last_seen_epoch FROM mesh_nodes WHERE node_id = ?",
                         (node_id,)
                     )
                     result = cursor.fetchone()
@@ -136,17 +151,16 @@ class NodeTracker:
                         # New node - insert into database
                         cursor.execute("""
                             INSERT INTO mesh_nodes 
-                            (node_id, node_name, first_seen_at, last_seen_at, message_count)
-                            VALUES (?, ?, ?, ?, 1)
-                        """, (node_id, node_name, now, now))
+                            (node_id, node_name, first_seen_at, last_seen_at, message_count, last_seen_epoch)
+                            VALUES (?, ?, ?, ?, 1, ?)
+                        """, (node_id, node_name, now, now, now_epoch))
                         
                         self.logger.info(f"New node tracked: {node_name} ({node_id})")
                         return True
                     
                     else:
                         # Existing node - check if it's been too long
-                        last_seen = datetime.fromisoformat(result['last_seen_at'])
-                        days_since_seen = (now - last_seen).days
+                        days_since_seen = self.days_since_seen(result, now_epoch)
                         
                         is_new = days_since_seen >= self.threshold_days
                         
@@ -156,9 +170,10 @@ class NodeTracker:
                             SET node_name = ?,
                                 last_seen_at = ?,
                                 message_count = message_count + 1,
-                                updated_at = ?
+                                updated_at = ?,
+                                last_seen_epoch = ?
                             WHERE node_id = ?
-                        """, (node_name, now, now, node_id))
+                        """, (node_name, now, now, now_epoch, node_id))
                         
                         if is_new:
                             self.logger.info(
@@ -177,6 +192,30 @@ class NodeTracker:
             self.logger.error(f"Error recording node activity for {node_id}: {e}")
             return False
     
+    @staticmethod
+    def days_since_seen(node: Any, now_epoch: Optional[int] = None) -> int:
+        """
+        Whole days since a node was last seen
+        
+        Uses the integer last_seen_epoch column, falling back to parsing
+        last_seen_at for rows that predate it.
+        
+        Args:
+            node: Row or dict with last_seen_epoch and last_seen_at
+            now_epoch: Current Unix time (defaults to now)
+            
+        Returns:
+            Number of days since the node was last seen
+        """
+        if now_epoch is None:
+            now_epoch = int(time.time())
+        
+        last_seen_epoch = node['last_seen_epoch']
+        if last_seen_epoch is None:
+            last_seen_epoch = int(datetime.fromisoformat(node['last_seen_at']).timestamp())
+        
+        return (now_epoch - last_seen_epoch) // 86400
+    
     def get_node_info(self, node_id: str) -> Optional[Dict[str, Any]]:
         """
         Get stored information about a node
@@ -204,6 +243,37 @@ class NodeTracker:
             self.logger.error(f"Error getting node info for {node_id}: {e}")
             return None
     
+    def iter_nodes(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over tracked nodes, most recently seen first
+        
+        Rows are streamed from the database cursor, so memory use stays
+        constant regardless of how many nodes are tracked. The connection
+        stays open until the iterator is exhausted or closed.
+        
+        Args:
+            limit: Maximum number of nodes to yield (None for all)
+            
+        Yields:
+            Dictionaries with node information
+            
+        Raises:
+            sqlite3.Error: If the database can't be read, including part-way
+                through, so callers never mistake a truncated result for a
+                complete one
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            query = "SELECT * FROM mesh_nodes ORDER BY last_seen_at DESC"
+            params = ()
+            if limit:
+                query += " LIMIT ?"
+                params = (limit,)
+            
+            for row in cursor.execute(query, params):
+                yield dict(row)
+    
     def get_all_nodes(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get list of all tracked nodes
@@ -215,18 +285,7 @@ class NodeTracker:
             List of dictionaries with node information
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = "SELECT * FROM mesh_nodes ORDER BY last_seen_at DESC"
-                if limit:
-                    query += f" LIMIT {limit}"
-                
-                cursor.execute(query)
-                results = cursor.fetchall()
-                
-                return [dict(row) for row in results]
-                
+            return list(self.iter_nodes(limit))
         except Exception as e:
             self.logger.error(f"Error getting all nodes: {e}")
             return []
@@ -270,9 +329,10 @@ class NodeTracker:
                     cursor.execute("""
                         UPDATE mesh_nodes 
                         SET last_seen_at = ?,
-                            updated_at = ?
+                            updated_at = ?,
+                            last_seen_epoch = ?
                         WHERE node_id = ?
-                    """, (old_date, datetime.now(), node_id))
+                    """, (old_date, datetime.now(), int(old_date.timestamp()), node_id))
                     
                     if cursor.rowcount > 0:
                         self.logger.info(f"Reset node tracking: {node_id}")
@@ -195,10 +195,9 @@ class BBMeshServer:
             is_healthy = self.mesh_interface._check_connection_health()
 
             # Calculate time since last message
-            from datetime import datetime
             last_msg_time = self.mesh_interface.last_received_message_time
             if last_msg_time:
-                time_since_msg = (datetime.now() - last_msg_time).total_seconds()
+                time_since_msg = time.time() - last_msg_time
                 msg_status = f"last_msg={time_since_msg:.0f}s_ago"
             else:
                 msg_status = "no_messages_yet"
@@ -164,6 +164,10 @@ class BBMeshLogger:
         user_info = f" [{user}]" if user else ""
         self.logger.error(f"ERROR{user_info} {context}: {error}")
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at level would be logged"""
+        return self.logger.isEnabledFor(level)
+    
     def debug(self, message: str) -> None:
         """Debug logging"""
         self.logger.debug(message)
@@ -0,0 +1,23 @@
+"""
+Dataclass helpers for BBMesh
+"""
+
+from dataclasses import fields
+
+
+def add_slots(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields
+
+    Equivalent to @dataclass(slots=True), which needs Python 3.10+. The
+    generated __init__ keeps the field defaults, so they can be dropped
+    from the class namespace.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
@@ -0,0 +1,55 @@
+"""
+Tests for the admin node manager
+"""
+
+from contextlib import contextmanager
+
+import pytest
+
+from bbmesh.core.admin_manager import AdminManager
+
+
+class _FakeMesh:
+    """Mesh interface stand-in that records sent messages"""
+
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, text, destination, channel=0):
+        self.sent.append((text, destination))
+        return True
+
+
+@pytest.fixture
+def manager(tmp_path):
+    config = {'admin_nodes': ['!admin1', '!admin2']}
+    mgr = AdminManager(str(tmp_path / "bbmesh.db"), config, _FakeMesh())
+    yield mgr
+    mgr.close()
+
+
+def test_active_admin_ids_after_deactivate(manager):
+    assert set(manager.get_active_admin_ids()) == {'!admin1', '!admin2'}
+
+    assert manager.deactivate_admin('!admin1')
+
+    assert manager.get_active_admin_ids() == ['!admin2']
+
+
+def test_invalidation_during_read_is_not_cached(manager, monkeypatch):
+    get_reader = manager._get_reader
+
+    @contextmanager
+    def racing_reader():
+        # Remove an admin after the query ran but before its result is cached
+        with get_reader() as conn:
+            yield conn
+        monkeypatch.setattr(manager, '_get_reader', get_reader)
+        assert manager.remove_admin('!admin1')
+
+    monkeypatch.setattr(manager, '_get_reader', racing_reader)
+
+    stale = manager.get_active_admin_ids()
+    assert '!admin1' in stale
+
+    assert manager.get_active_admin_ids() == ['!admin2']